@@ -4,6 +4,7 @@ Coordinates all sensors and logs vehicle data to CSV files.
 """
 
 import logging
+import os
 import time
 import json
 import csv
@@ -13,13 +14,34 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, Optional
 from threading import Thread, Event, Lock
-import queue
+from collections import deque
+import operator
 
 # Import sensor modules
 from sensors import OBDInterface, Accelerometer, GPS, TemperatureSensors
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON, using orjson when available."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize JSON with 2-space indent, using orjson when available."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
 
 class DataLogger:
     """
@@ -29,6 +51,34 @@ class DataLogger:
     and writes to CSV files with proper buffering and error handling.
     """
 
+    # Cached connection flag for each sensor key in self.errors
+    _SENSOR_FLAGS = {
+        'obd': '_obd_ok',
+        'accelerometer': '_accel_ok',
+        'gps': '_gps_ok',
+        'temperature': '_temp_ok'
+    }
+
+    # CSV column order
+    CSV_HEADERS = [
+        'timestamp',
+        'elapsed_time',
+        # OBD-II
+        'rpm', 'speed_mph', 'throttle_pos', 'coolant_temp_f', 'intake_temp_f',
+        'maf_gps', 'engine_load', 'timing_advance', 'fuel_trim_short', 'fuel_trim_long',
+        # Accelerometer
+        'accel_long_g', 'accel_lat_g', 'accel_vert_g', 'accel_total_g',
+        'pitch_deg', 'roll_deg', 'yaw_rate_dps',
+        # GPS
+        'gps_lat', 'gps_lon', 'gps_alt_m', 'gps_speed_mph',
+        'gps_heading', 'gps_satellites', 'gps_valid',
+        # Temperature
+        'temp_oil_f', 'temp_intake_f', 'temp_brake_f', 'temp_trans_f', 'temp_ambient_f'
+    ]
+
+    # Projects a sample dict to a row tuple in CSV_HEADERS order
+    _row_values = staticmethod(operator.itemgetter(*CSV_HEADERS))
+
     def __init__(self, config_dir: str = "config", data_dir: str = "data/sessions"):
         """
         Initialize data logger.
@@ -58,12 +108,34 @@ class DataLogger:
         self.session_dir: Optional[Path] = None
         self.csv_file = None
         self.csv_writer = None
-        self.csv_buffer = []
+        # Every sample starts as a copy of this, so rows never resize
+        self._row_template = dict.fromkeys(self.CSV_HEADERS)
+        self.csv_buffer_size = self.system_config.get('data', {}).get('csv_buffer_size', 100)
+        self.csv_max_age = self.system_config.get('data', {}).get('csv_max_age_seconds', 1.0)
+
+        # Double buffer: acquisition appends to the active buffer while the
+        # writer thread drains the other one. Bounded so a stalled disk drops
+        # the oldest samples instead of growing memory without limit.
+        self.max_backlog = self.system_config.get('data', {}).get('max_backlog', 10000)
+        self._buffers = [deque(maxlen=self.max_backlog), deque(maxlen=self.max_backlog)]
+        self._active = 0
+        self._dropped_samples = 0
+        self._buffer_oldest_ts: Optional[float] = None
+
+        # A buffer that fails to write is retried on the next hand-over; after
+        # csv_write_retries attempts its rows are dropped so the writer can
+        # move on. Only the writer thread touches these counters.
+        self.csv_write_retries = self.system_config.get('data', {}).get('csv_write_retries', 3)
+        self._write_failures = 0
+        self._write_dropped = 0
 
         # Threading control
         self.running = Event()
-        self.data_queue = queue.Queue()
+        self._stopped = False
         self.data_lock = Lock()
+        self._flush_event = Event()
+        self._writer_stop = Event()
+        self._writer_thread: Optional[Thread] = None
 
         # Statistics
         self.samples_collected = 0
@@ -75,6 +147,14 @@ class DataLogger:
             'temperature': 0
         }
 
+        # Cached connection state (refreshed by _refresh_sensor_state)
+        self._obd_ok = False
+        self._accel_ok = False
+        self._gps_ok = False
+        self._temp_ok = False
+        self._error_streak = dict.fromkeys(self.errors, 0)
+        self.sensor_error_threshold = self.system_config.get('performance', {}).get('sensor_error_threshold', 10)
+
         # Setup logging
         self._setup_logging()
 
@@ -82,8 +162,7 @@ class DataLogger:
         """Load JSON configuration file."""
         config_path = self.config_dir / filename
         try:
-            with open(config_path, 'r') as f:
-                return json.load(f)
+            return _json_loads(config_path.read_bytes())
         except FileNotFoundError:
             logger.error(f"Configuration file not found: {config_path}")
             return {}
@@ -193,8 +272,39 @@ class DataLogger:
             logger.error(f"Temperature sensors exception: {e}")
             success = False
 
+        self._refresh_sensor_state()
         return success
 
+    def _refresh_sensor_state(self):
+        """
+        Cache sensor connection state for collect_data.
+
+        Avoids calling is_connected() on every sensor each sample. Also
+        resets error streaks so sensors disabled by _record_error get retried.
+        """
+        self._obd_ok = bool(self.obd and self.obd.is_connected())
+        self._accel_ok = bool(self.accelerometer and self.accelerometer.is_connected())
+        self._gps_ok = bool(self.gps and self.gps.is_connected())
+        self._temp_ok = bool(self.temp_sensors and self.temp_sensors.is_connected())
+        self._error_streak = dict.fromkeys(self.errors, 0)
+
+    def _record_error(self, sensor: str):
+        """
+        Count a sensor read error, disabling the sensor after too many in a row.
+
+        The streak is reset by every successful read in collect_data().
+
+        Args:
+            sensor: Sensor key in self.errors
+        """
+        self.errors[sensor] += 1
+        self._error_streak[sensor] += 1
+
+        if self._error_streak[sensor] == self.sensor_error_threshold:
+            logger.warning("Disabling %s after %d errors - will retry at next status check",
+                           sensor, self.sensor_error_threshold)
+            setattr(self, self._SENSOR_FLAGS[sensor], False)
+
     def create_session(self) -> bool:
         """
         Create new logging session directory and CSV file.
@@ -213,30 +323,17 @@ class DataLogger:
         csv_path = self.session_dir / "data.csv"
 
         try:
-            self.csv_file = open(csv_path, 'w', newline='')
-
-            # Define CSV headers
-            headers = [
-                'timestamp',
-                'elapsed_time',
-                # OBD-II
-                'rpm', 'speed_mph', 'throttle_pos', 'coolant_temp_f', 'intake_temp_f',
-                'maf_gps', 'engine_load', 'timing_advance', 'fuel_trim_short', 'fuel_trim_long',
-                # Accelerometer
-                'accel_long_g', 'accel_lat_g', 'accel_vert_g', 'accel_total_g',
-                'pitch_deg', 'roll_deg', 'yaw_rate_dps',
-                # GPS
-                'gps_lat', 'gps_lon', 'gps_alt_m', 'gps_speed_mph',
-                'gps_heading', 'gps_satellites', 'gps_valid',
-                # Temperature
-                'temp_oil_f', 'temp_intake_f', 'temp_brake_f', 'temp_trans_f', 'temp_ambient_f'
-            ]
-
-            self.csv_writer = csv.DictWriter(self.csv_file, fieldnames=headers)
-            self.csv_writer.writeheader()
-            self.csv_file.flush()
+            # 1 MiB buffer so rows reach disk in large writes rather than every ~40 samples
+            self.csv_file = open(csv_path, 'w', newline='', buffering=1 << 20)
+
+            self.csv_writer = csv.writer(self.csv_file)
+            self.csv_writer.writerow(self.CSV_HEADERS)
 
             logger.info(f"CSV file created: {csv_path}")
+
+            self._writer_stop.clear()
+            self._writer_thread = Thread(target=self._writer_loop, name="csv-writer", daemon=True)
+            self._writer_thread.start()
             return True
 
         except Exception as e:
@@ -250,61 +347,49 @@ class DataLogger:
         Returns:
             Dictionary with all sensor data
         """
-        data = {
-            'timestamp': datetime.now().isoformat(),
-            'elapsed_time': time.time() - self.session_start_time if self.session_start_time else 0
-        }
+        data = self._row_template.copy()
+        data['timestamp'] = datetime.now().isoformat()
+        data['elapsed_time'] = time.time() - self.session_start_time if self.session_start_time else 0
 
         # Collect OBD-II data
-        if self.obd and self.obd.is_connected():
+        if self._obd_ok:
             try:
-                obd_data = self.obd.read_all_pids()
-                data['rpm'] = self._extract_value(obd_data.get('RPM'))
-                data['speed_mph'] = self._extract_value(obd_data.get('SPEED'))
-                data['throttle_pos'] = self._extract_value(obd_data.get('THROTTLE_POS'))
-                data['coolant_temp_f'] = self._extract_value(obd_data.get('COOLANT_TEMP'))
-                data['intake_temp_f'] = self._extract_value(obd_data.get('INTAKE_TEMP'))
-                data['maf_gps'] = self._extract_value(obd_data.get('MAF'))
-                data['engine_load'] = self._extract_value(obd_data.get('ENGINE_LOAD'))
-                data['timing_advance'] = self._extract_value(obd_data.get('TIMING_ADVANCE'))
-                data['fuel_trim_short'] = self._extract_value(obd_data.get('SHORT_FUEL_TRIM_1'))
-                data['fuel_trim_long'] = self._extract_value(obd_data.get('LONG_FUEL_TRIM_1'))
+                (data['rpm'], data['speed_mph'], data['throttle_pos'],
+                 data['coolant_temp_f'], data['intake_temp_f'], data['maf_gps'],
+                 data['engine_load'], data['timing_advance'],
+                 data['fuel_trim_short'], data['fuel_trim_long']) = self.obd.read_all_pids_tuple()
             except Exception as e:
-                logger.error(f"Error collecting OBD data: {e}")
-                self.errors['obd'] += 1
+                logger.error("Error collecting OBD data: %s", e)
+                self._record_error('obd')
+            else:
+                self._error_streak['obd'] = 0
 
         # Collect Accelerometer data
-        if self.accelerometer and self.accelerometer.is_connected():
+        if self._accel_ok:
             try:
-                accel_data = self.accelerometer.read_all()
-                data['accel_long_g'] = accel_data.get('longitudinal_g')
-                data['accel_lat_g'] = accel_data.get('lateral_g')
-                data['accel_vert_g'] = accel_data.get('vertical_g')
-                data['accel_total_g'] = accel_data.get('total_g')
-                data['pitch_deg'] = accel_data.get('pitch_deg')
-                data['roll_deg'] = accel_data.get('roll_deg')
-                data['yaw_rate_dps'] = accel_data.get('yaw_rate_dps')
+                (data['accel_long_g'], data['accel_lat_g'], data['accel_vert_g'],
+                 data['accel_total_g'], data['pitch_deg'], data['roll_deg'],
+                 data['yaw_rate_dps']) = self.accelerometer.read_all_tuple()
             except Exception as e:
-                logger.error(f"Error collecting accelerometer data: {e}")
-                self.errors['accelerometer'] += 1
+                logger.error("Error collecting accelerometer data: %s", e)
+                self._record_error('accelerometer')
+            else:
+                self._error_streak['accelerometer'] = 0
 
         # Collect GPS data
-        if self.gps and self.gps.is_connected():
+        if self._gps_ok:
             try:
-                gps_data = self.gps.read()
-                data['gps_lat'] = gps_data.get('latitude')
-                data['gps_lon'] = gps_data.get('longitude')
-                data['gps_alt_m'] = gps_data.get('altitude_m')
-                data['gps_speed_mph'] = gps_data.get('speed_mph')
-                data['gps_heading'] = gps_data.get('track_deg')
-                data['gps_satellites'] = gps_data.get('satellites')
-                data['gps_valid'] = gps_data.get('valid')
+                (data['gps_lat'], data['gps_lon'], data['gps_alt_m'],
+                 data['gps_speed_mph'], data['gps_heading'], data['gps_satellites'],
+                 data['gps_valid']) = self.gps.read_tuple()
             except Exception as e:
-                logger.error(f"Error collecting GPS data: {e}")
-                self.errors['gps'] += 1
+                logger.error("Error collecting GPS data: %s", e)
+                self._record_error('gps')
+            else:
+                self._error_streak['gps'] = 0
 
         # Collect Temperature data
-        if self.temp_sensors and self.temp_sensors.is_connected():
+        if self._temp_ok:
             try:
                 temp_data = self.temp_sensors.read_all()
                 data['temp_oil_f'] = temp_data.get('engine_oil')
@@ -314,58 +399,132 @@ class DataLogger:
                 data['temp_ambient_f'] = temp_data.get('ambient')
 
                 # Check temperature thresholds
-                alerts = self.temp_sensors.check_thresholds()
+                alerts = self.temp_sensors.check_thresholds(temp_data)
                 if alerts['critical']:
-                    logger.critical(f"CRITICAL TEMPERATURE: {', '.join(alerts['critical'])}")
+                    logger.critical("CRITICAL TEMPERATURE: %s", ', '.join(alerts['critical']))
                 elif alerts['warnings']:
-                    logger.warning(f"Temperature warning: {', '.join(alerts['warnings'])}")
+                    logger.warning("Temperature warning: %s", ', '.join(alerts['warnings']))
 
             except Exception as e:
-                logger.error(f"Error collecting temperature data: {e}")
-                self.errors['temperature'] += 1
+                logger.error("Error collecting temperature data: %s", e)
+                self._record_error('temperature')
+            else:
+                self._error_streak['temperature'] = 0
 
         return data
 
-    def _extract_value(self, obj):
-        """Extract numeric value from OBD response object."""
-        if obj is None:
-            return None
-        if hasattr(obj, 'magnitude'):
-            return obj.magnitude
-        return obj
-
     def write_data(self, data: Dict[str, Any]):
         """
         Write data to CSV file with buffering.
 
+        Appends to the active buffer without locking (the acquisition loop is
+        the only producer). When the buffer is full it is handed to the
+        writer thread, unless the writer is still draining the previous one,
+        in which case the active buffer keeps growing until the next sample.
+        Once it reaches max_backlog the oldest sample is dropped and counted.
+        run() also hands the buffer over once its oldest sample is older
+        than csv_max_age_seconds.
+
         Args:
             data: Dictionary of sensor data
         """
         try:
-            with self.data_lock:
-                self.csv_buffer.append(data)
-                self.samples_collected += 1
-
-                # Flush buffer when it reaches configured size
-                buffer_size = self.system_config.get('data', {}).get('csv_buffer_size', 100)
-                if len(self.csv_buffer) >= buffer_size:
-                    self._flush_buffer()
+            buffer = self._buffers[self._active]
+            if not buffer:
+                self._buffer_oldest_ts = time.monotonic()
+            elif len(buffer) == self.max_backlog:
+                self._dropped_samples += 1
+            buffer.append(data)
+            self.samples_collected += 1
+
+            # Flush buffer when it reaches configured size
+            if len(buffer) >= self.csv_buffer_size:
+                self._swap_buffers()
 
         except Exception as e:
-            logger.error(f"Error writing data: {e}")
+            logger.error("Error writing data: %s", e)
+
+    def _swap_buffers(self) -> bool:
+        """
+        Hand the active buffer to the writer thread.
+
+        If the writer still holds the previous buffer (busy, or its last write
+        failed) the writer is woken again instead so it retries.
+
+        Returns:
+            True if swapped, False if the writer is still busy
+        """
+        if self._buffers[self._active ^ 1]:
+            self._flush_event.set()
+            return False
+
+        self._active ^= 1
+        self._buffer_oldest_ts = None
+        self._flush_event.set()
+        return True
+
+    def _writer_loop(self):
+        """Background thread that writes full buffers to the CSV file."""
+        last_sync = time.monotonic()
+
+        while not self._writer_stop.is_set():
+            self._flush_event.wait()
+            self._flush_event.clear()
+            self._flush_buffer(self._buffers[self._active ^ 1])
+
+            # Push the file buffer to the OS at most once per max age, so a
+            # crash loses a bounded window rather than up to 1 MiB of rows
+            now = time.monotonic()
+            if now - last_sync >= self.csv_max_age:
+                try:
+                    with self.data_lock:
+                        self.csv_file.flush()
+                except Exception as e:
+                    logger.error("Error flushing CSV file: %s", e)
+                last_sync = now
+
+    def _stop_writer(self):
+        """Stop the writer thread and write out both buffers."""
+        if self._writer_thread:
+            self._writer_stop.set()
+            self._flush_event.set()
+            self._writer_thread.join()
+            self._writer_thread = None
+
+        # Inactive buffer holds the older samples
+        self._flush_buffer(self._buffers[self._active ^ 1])
+        self._flush_buffer(self._buffers[self._active])
+
+    def _flush_buffer(self, buffer: deque):
+        """
+        Flush a sample buffer to the CSV file.
+
+        On failure the rows stay in the buffer for the next attempt. After
+        csv_write_retries consecutive failures they are dropped and counted,
+        so a persistent write error cannot stall the writer for good.
 
-    def _flush_buffer(self):
-        """Flush CSV buffer to file."""
-        if not self.csv_buffer:
+        Args:
+            buffer: Deque of sample dictionaries, cleared once written
+        """
+        if not buffer:
             return
 
         try:
-            self.csv_writer.writerows(self.csv_buffer)
-            self.csv_file.flush()
-            logger.debug(f"Flushed {len(self.csv_buffer)} samples to CSV")
-            self.csv_buffer.clear()
+            with self.data_lock:
+                # Plain csv.writer on tuples skips DictWriter's per-row key check
+                self.csv_writer.writerows(map(self._row_values, buffer))
+            logger.debug("Flushed %d samples to CSV", len(buffer))
+            buffer.clear()
+            self._write_failures = 0
         except Exception as e:
-            logger.error(f"Error flushing buffer: {e}")
+            self._write_failures += 1
+            logger.error("Error flushing buffer (attempt %d/%d): %s",
+                         self._write_failures, self.csv_write_retries, e)
+            if self._write_failures >= self.csv_write_retries:
+                logger.error("Dropping %d samples after repeated write failures", len(buffer))
+                self._write_dropped += len(buffer)
+                buffer.clear()
+                self._write_failures = 0
 
     def run(self):
         """Main data collection loop."""
@@ -390,13 +549,19 @@ class DataLogger:
                 # Write to CSV
                 self.write_data(data)
 
+                # Hand over a partial buffer if samples have waited too long
+                oldest = self._buffer_oldest_ts
+                if oldest is not None and time.monotonic() - oldest > self.csv_max_age:
+                    self._swap_buffers()
+
                 # Print status periodically
                 if time.time() - last_status_time >= status_interval:
                     self._print_status()
+                    self._refresh_sensor_state()
                     last_status_time = time.time()
 
             except Exception as e:
-                logger.error(f"Error in main loop: {e}")
+                logger.error("Error in main loop: %s", e)
 
             # Sleep to maintain target rate
             loop_duration = time.time() - loop_start
@@ -412,20 +577,35 @@ class DataLogger:
 
         logger.info(f"Session: {elapsed:.1f}s | Samples: {self.samples_collected} | Rate: {rate:.1f} Hz")
         logger.info(f"Errors - OBD: {self.errors['obd']} | Accel: {self.errors['accelerometer']} | "
-                   f"GPS: {self.errors['gps']} | Temp: {self.errors['temperature']}")
+                   f"GPS: {self.errors['gps']} | Temp: {self.errors['temperature']} | "
+                   f"Dropped: {self._dropped_samples + self._write_dropped}")
 
     def stop(self):
-        """Stop data collection and cleanup."""
+        """
+        Stop data collection and cleanup.
+
+        Safe to call more than once: the signal handler stops the logger and
+        main() stops it again on the way out.
+        """
+        if self._stopped:
+            return
+        self._stopped = True
+
         logger.info("Stopping data logger...")
         self.running.clear()
 
-        # Flush remaining buffer
-        with self.data_lock:
-            self._flush_buffer()
+        # Flush remaining buffers
+        self._stop_writer()
 
         # Close CSV file
         if self.csv_file:
+            try:
+                self.csv_file.flush()
+                os.fsync(self.csv_file.fileno())
+            except (OSError, ValueError) as e:
+                logger.error("Failed to sync CSV file: %s", e)
             self.csv_file.close()
+            self.csv_file = None
             logger.info("CSV file closed")
 
         # Save session summary
@@ -434,6 +614,8 @@ class DataLogger:
         # Disconnect sensors
         if self.obd:
             self.obd.disconnect()
+        if self.temp_sensors:
+            self.temp_sensors.close()
         logger.info("Sensors disconnected")
 
     def _save_session_summary(self):
@@ -446,6 +628,7 @@ class DataLogger:
             'session_end': datetime.now().isoformat(),
             'duration_seconds': time.time() - self.session_start_time if self.session_start_time else 0,
             'samples_collected': self.samples_collected,
+            'dropped_samples': self._dropped_samples + self._write_dropped,
             'errors': self.errors,
             'vehicle': self.vehicle_config.get('vehicle', {}),
             'simulation_mode': self.simulation_mode
@@ -453,8 +636,7 @@ class DataLogger:
 
         summary_path = self.session_dir / "session_summary.json"
         try:
-            with open(summary_path, 'w') as f:
-                json.dump(summary, f, indent=2)
+            summary_path.write_bytes(_json_dumps(summary))
             logger.info(f"Session summary saved: {summary_path}")
         except Exception as e:
             logger.error(f"Failed to save session summary: {e}")
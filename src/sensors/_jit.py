@@ -0,0 +1,19 @@
+"""
+Optional numba JIT shared by the sensor modules.
+Falls back to a no-op decorator so jitted functions run as plain Python.
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit
+except ImportError:
+    logger.debug("numba not available - jitted sensor math runs as plain Python")
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function as plain Python."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
@@ -0,0 +1,50 @@
+"""
+Pre-drawn simulation noise shared by the sensor modules.
+Drawing from numpy per sample costs more than the simulation itself.
+"""
+
+from typing import Optional
+import numpy as np
+
+
+class NoisePool:
+    """
+    Ring of pre-drawn uniform noise in [-1, 1).
+
+    The first `pad` values are repeated at the end so a take never has to
+    wrap mid-slice.
+    """
+
+    def __init__(self, size: int = 4096, pad: int = 16, dtype=np.float32,
+                 rng: Optional[np.random.Generator] = None):
+        """
+        Draw the pool.
+
+        Args:
+            size: Number of distinct values (must be a power of two)
+            pad: Largest number of values a single take may request
+            dtype: np.float32 or np.float64
+            rng: Random generator to draw from (a fresh one if None)
+        """
+        if size & (size - 1):
+            raise ValueError(f"Noise pool size must be a power of two, got {size}")
+
+        rng = rng if rng is not None else np.random.default_rng()
+        pool = rng.random(size, dtype=dtype) * 2.0 - 1.0
+        self._pool = np.concatenate((pool, pool[:pad]))
+        self._mask = size - 1
+        self._i = 0
+
+    def take(self, n: int) -> np.ndarray:
+        """
+        Take n consecutive values from the pool.
+
+        Args:
+            n: Number of values (at most pad)
+
+        Returns:
+            View into the pool; do not modify
+        """
+        i = self._i
+        self._i = (i + n) & self._mask
+        return self._pool[i:i + n]
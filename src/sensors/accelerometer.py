@@ -9,8 +9,14 @@ import math
 from typing import Dict, Tuple, Optional, Any
 import numpy as np
 
+from ._jit import njit
+from ._noise import NoisePool
+
 logger = logging.getLogger(__name__)
 
+# Radians to degrees (avoids a math.degrees call per value)
+RAD2DEG = 57.29577951308232
+
 try:
     import board
     import busio
@@ -20,6 +26,113 @@ except (ImportError, NotImplementedError):
     HAS_HARDWARE = False
     logger.warning("MPU6050 hardware libraries not available - will run in simulation mode")
 
+try:
+    import numexpr as ne
+    HAS_NUMEXPR = True
+except ImportError:
+    HAS_NUMEXPR = False
+
+
+@njit(cache=True)
+def _fast_atan2(y: float, x: float) -> float:
+    """
+    Polynomial approximation of atan2.
+
+    Max error is about 0.0015 rad (0.09°), well under the 0.1° display
+    resolution, and avoids libm's range reduction.
+
+    Args:
+        y, x: Coordinates as for math.atan2
+
+    Returns:
+        Angle in radians in [-pi, pi]
+    """
+    ax = abs(x)
+    ay = abs(y)
+    if ax == 0.0 and ay == 0.0:
+        return 0.0
+
+    # Approximate atan on [0, 1] and reflect into the right octant
+    if ax >= ay:
+        r = ay / ax
+        angle = 0.7853981633974483 * r - r * (r - 1.0) * (0.2447 + 0.0663 * r)
+    else:
+        r = ax / ay
+        angle = 1.5707963267948966 - (0.7853981633974483 * r - r * (r - 1.0) * (0.2447 + 0.0663 * r))
+
+    if x < 0.0:
+        angle = 3.141592653589793 - angle
+    if y < 0.0:
+        angle = -angle
+    return angle
+
+
+@njit(cache=True, fastmath=True)
+def _cf_step(ax: float, ay: float, az: float, gx: float, gy: float,
+             pitch: float, roll: float, dt: float,
+             alpha: float, dyn_threshold: float, gravity: float) -> Tuple[float, float]:
+    """
+    One adaptive complementary filter update.
+
+    Args:
+        ax, ay, az: Calibrated acceleration in vehicle frame (m/s²)
+        gx, gy: Roll and pitch rates (rad/s)
+        pitch, roll: Previous filter state (rad)
+        dt: Time since previous update (s)
+        alpha: Base gyro weight
+        dyn_threshold: Dynamic acceleration at which alpha reaches 1 (m/s²)
+        gravity: Gravitational constant (m/s²)
+
+    Returns:
+        Tuple of (pitch, roll) in radians
+    """
+    # Pitch and roll from accelerometer
+    accel_pitch = _fast_atan2(ax, math.hypot(ay, az))
+    accel_roll = _fast_atan2(ay, math.hypot(ax, az))
+
+    # Adaptive weight: move alpha towards 1 as dynamic acceleration grows
+    dyn = abs(math.sqrt(ax * ax + ay * ay + az * az) - gravity)
+    a = min(1.0, alpha + (1.0 - alpha) * dyn / dyn_threshold)
+
+    # Combine integrated gyro (short-term) and accel (long-term)
+    pitch = a * (pitch + gy * dt) + (1.0 - a) * accel_pitch
+    roll = a * (roll + gx * dt) + (1.0 - a) * accel_roll
+    return pitch, roll
+
+
+@njit(cache=True)
+def _cf_batch(accel_pitch: np.ndarray, accel_roll: np.ndarray,
+              gx: np.ndarray, gy: np.ndarray, dt: np.ndarray, alpha: np.ndarray,
+              pitch: float, roll: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Run the complementary filter blend over a batch of samples.
+
+    The tilt estimates and per-sample weights are computed vectorized by
+    the caller; only the recurrent blend is done here, one sample at a time.
+
+    Args:
+        accel_pitch, accel_roll: Accelerometer tilt per sample (rad)
+        gx, gy: Roll and pitch rates per sample (rad/s)
+        dt: Time since previous sample (s)
+        alpha: Gyro weight per sample
+        pitch, roll: Filter state before the first sample (rad)
+
+    Returns:
+        Tuple of (pitch, roll) arrays in radians
+    """
+    n = accel_pitch.shape[0]
+    pitch_out = np.empty(n)
+    roll_out = np.empty(n)
+
+    for i in range(n):
+        a = alpha[i]
+        pitch = a * (pitch + gy[i] * dt[i]) + (1.0 - a) * accel_pitch[i]
+        roll = a * (roll + gx[i] * dt[i]) + (1.0 - a) * accel_roll[i]
+        pitch_out[i] = pitch
+        roll_out[i] = roll
+
+    return pitch_out, roll_out
+
 
 class Accelerometer:
     """
@@ -46,35 +159,72 @@ class Accelerometer:
         self.connected = False
 
         # Calibration offsets (from calibration process)
+        # The pipeline runs in float32: ample for a 16-bit ADC and 0.001g output
         calibration = config.get('calibration', {})
         self.accel_offset = np.array([
             calibration.get('accel_offset_x', 0.0),
             calibration.get('accel_offset_y', 0.0),
             calibration.get('accel_offset_z', 0.0)
-        ])
+        ], dtype=np.float32)
         self.gyro_offset = np.array([
             calibration.get('gyro_offset_x', 0.0),
             calibration.get('gyro_offset_y', 0.0),
             calibration.get('gyro_offset_z', 0.0)
-        ])
+        ], dtype=np.float32)
 
         # Rotation matrix to transform sensor frame to vehicle frame
         # Default is identity (no rotation)
-        self.rotation_matrix = np.array(calibration.get('rotation_matrix', [
+        self.rotation_matrix = np.ascontiguousarray(calibration.get('rotation_matrix', [
             [1, 0, 0],
             [0, 1, 0],
             [0, 0, 1]
-        ]))
+        ]), dtype=np.float32)
+        # Skip the rotation entirely for the default (aligned) mounting
+        self._rot_is_identity = np.allclose(self.rotation_matrix, np.eye(3))
+
+        # Offset removal folded into the transform: R @ (v - o) == R @ v + (-R @ o)
+        # Columns are the accel and gyro bias in vehicle frame
+        self._bias = -(self.rotation_matrix @ np.column_stack((self.accel_offset, self.gyro_offset)))
+        self._accel_bias = np.ascontiguousarray(self._bias[:, 0])
+        self._gyro_bias = np.ascontiguousarray(self._bias[:, 1])
+
+        # Persistent output for read_calibrated: [ax, ay, az, gx, gy, gz].
+        # _work_cols views it as 3x2 (accel, gyro columns) for the matmul.
+        self._work = np.empty(6, dtype=np.float32)
+        self._work_cols = self._work.reshape(2, 3).T
+        self._raw_cols = np.empty((3, 2), dtype=np.float32)
+
+        # Precomputed constants for g-force conversion
+        self._inv_g = 1.0 / self.GRAVITY
+        self._g_vec = np.array([0.0, 0.0, self.GRAVITY], dtype=np.float32)
 
         # Complementary filter state
         self.filter_alpha = config.get('filter', {}).get('alpha', 0.98)
+        # Dynamic acceleration (m/s²) at which the filter ignores the accelerometer
+        self.dyn_threshold = config.get('filter', {}).get('dyn_threshold', 1.0)
         self.pitch = 0.0
         self.roll = 0.0
-        self.last_time = time.time()
+        self.last_time_ns = time.monotonic_ns()
+
+        # Persistent result dicts, overwritten in place on every read
+        self._g_out = {'longitudinal_g': 0.0, 'lateral_g': 0.0, 'vertical_g': 0.0, 'total_g': 0.0}
+        self._orient_out = {'pitch_deg': 0.0, 'roll_deg': 0.0, 'yaw_rate_dps': 0.0}
+        self._all_out = {**self._g_out, **self._orient_out}
+
+        # Preallocated buffers for read_batch (one logging batch)
+        self.batch_size = config.get('batch_size', 50)
+        self._accel_buf = np.empty((self.batch_size, 3), dtype=np.float32)
+        self._gyro_buf = np.empty((self.batch_size, 3), dtype=np.float32)
+        self._time_buf = np.empty(self.batch_size, dtype=np.int64)
+        self._dyn_buf = np.empty(self.batch_size, dtype=np.float32)
+        self._g_f32 = np.float32(self.GRAVITY)
 
         # Simulation state
-        self.sim_time = time.time()
+        self.sim_time_ns = time.monotonic_ns()
         self.sim_speed = 0.0
+        self._noise = NoisePool()
+        # Gyro noise amplitude (rad/s): roll, pitch, yaw
+        self._sim_gyro_scale = np.array([0.1, 0.1, 0.2], dtype=np.float32)
 
     def connect(self) -> bool:
         """
@@ -143,103 +293,227 @@ class Accelerometer:
             accel_raw = self.sensor.acceleration  # m/s²
             gyro_raw = self.sensor.gyro  # rad/s
 
-            accel = np.array(accel_raw)
-            gyro = np.array(gyro_raw)
+            accel = np.asarray(accel_raw, dtype=np.float32)
+            gyro = np.asarray(gyro_raw, dtype=np.float32)
 
             return accel, gyro
 
         except Exception as e:
             logger.error(f"Error reading MPU6050: {e}")
-            return np.zeros(3), np.zeros(3)
+            return np.zeros(3, dtype=np.float32), np.zeros(3, dtype=np.float32)
 
     def read_calibrated(self) -> Tuple[np.ndarray, np.ndarray]:
         """
         Read calibrated accelerometer and gyroscope values.
 
-        Applies offset correction and coordinate transformation.
+        Applies offset correction and coordinate transformation as a single
+        affine step (rotation plus precomputed bias).
+
+        The returned arrays are views into a buffer that is overwritten by
+        the next call; copy them if they need to be kept.
 
         Returns:
             Tuple of (acceleration, gyro_rate) in vehicle frame
             Acceleration in m/s², gyro in rad/s
         """
         accel_raw, gyro_raw = self.read_raw()
+        accel = self._work[:3]
+        gyro = self._work[3:]
 
-        # Apply offsets
-        accel_corrected = accel_raw - self.accel_offset
-        gyro_corrected = gyro_raw - self.gyro_offset
+        if self._rot_is_identity:
+            np.add(accel_raw, self._accel_bias, out=accel)
+            np.add(gyro_raw, self._gyro_bias, out=gyro)
+            return accel, gyro
 
-        # Transform to vehicle coordinate frame
+        # Transform to vehicle coordinate frame, both vectors in one matmul
         # Vehicle frame: X=forward, Y=left, Z=up
-        accel_vehicle = self.rotation_matrix @ accel_corrected
-        gyro_vehicle = self.rotation_matrix @ gyro_corrected
+        raw = self._raw_cols
+        raw[:, 0] = accel_raw
+        raw[:, 1] = gyro_raw
+        np.matmul(self.rotation_matrix, raw, out=self._work_cols)
+        np.add(self._work_cols, self._bias, out=self._work_cols)
 
-        return accel_vehicle, gyro_vehicle
+        return accel, gyro
 
     def read_g_forces(self) -> Dict[str, float]:
         """
         Read acceleration as g-forces in vehicle frame.
 
+        The returned dict is reused and overwritten by the next call; copy it
+        if it needs to be kept.
+
         Returns:
             Dictionary with longitudinal, lateral, vertical g-forces
         """
         accel, gyro = self.read_calibrated()
 
-        # Convert m/s² to g-forces
+        # Convert m/s² to g-forces in one vector op
         # Note: we subtract gravity from vertical to get dynamic g-force
-        g_long = accel[0] / self.GRAVITY  # Forward/backward
-        g_lat = accel[1] / self.GRAVITY   # Left/right
-        g_vert = (accel[2] - self.GRAVITY) / self.GRAVITY  # Up/down (minus 1g static)
+        g = (accel - self._g_vec) * self._inv_g
+        g_long, g_lat, g_vert = g.tolist()
 
-        return {
-            'longitudinal_g': g_long,
-            'lateral_g': g_lat,
-            'vertical_g': g_vert,
-            'total_g': math.sqrt(g_long**2 + g_lat**2 + g_vert**2)
-        }
+        out = self._g_out
+        out['longitudinal_g'] = g_long  # Forward/backward
+        out['lateral_g'] = g_lat        # Left/right
+        out['vertical_g'] = g_vert      # Up/down (minus 1g static)
+        out['total_g'] = float(np.linalg.norm(g))
+        return out
 
     def read_orientation(self) -> Dict[str, float]:
         """
         Calculate vehicle pitch and roll using complementary filter.
 
+        The filter weight adapts to how far the measured acceleration is from
+        1g: under hard acceleration, braking or cornering the accelerometer
+        tilt estimate is unreliable, so the gyro is trusted more.
+
+        The returned dict is reused and overwritten by the next call; copy it
+        if it needs to be kept.
+
         Returns:
             Dictionary with pitch and roll in degrees
         """
         accel, gyro = self.read_calibrated()
 
-        # Calculate time delta
-        current_time = time.time()
-        dt = current_time - self.last_time
-        self.last_time = current_time
+        # Calculate time delta (monotonic, so clock adjustments can't upset the filter)
+        now = time.monotonic_ns()
+        dt = (now - self.last_time_ns) * 1e-9
+        self.last_time_ns = now
+
+        # Complementary filter on plain floats and locals
+        ax, ay, az = accel.tolist()
+        gx, gy, gz = gyro.tolist()
+        pitch, roll = _cf_step(
+            ax, ay, az, gx, gy, self.pitch, self.roll, dt,
+            self.filter_alpha, self.dyn_threshold, self.GRAVITY
+        )
+        self.pitch = pitch
+        self.roll = roll
+
+        out = self._orient_out
+        out['pitch_deg'] = pitch * RAD2DEG
+        out['roll_deg'] = roll * RAD2DEG
+        out['yaw_rate_dps'] = gz * RAD2DEG
+        return out
+
+    def read_all(self) -> Dict[str, float]:
+        """
+        Read all accelerometer data (g-forces and orientation).
+
+        Returns:
+            Dictionary with all acceleration and orientation data
+        """
+        data = self._all_out
+        data.update(self.read_g_forces())
+        data.update(self.read_orientation())
+        return data.copy()
 
-        # Calculate pitch and roll from accelerometer
-        accel_pitch = math.atan2(accel[0], math.sqrt(accel[1]**2 + accel[2]**2))
-        accel_roll = math.atan2(accel[1], math.sqrt(accel[0]**2 + accel[2]**2))
+    def read_all_tuple(self) -> Tuple[float, ...]:
+        """
+        Read all accelerometer data as a fixed-order tuple.
 
-        # Integrate gyroscope for pitch and roll rates
-        gyro_pitch = self.pitch + gyro[1] * dt
-        gyro_roll = self.roll + gyro[0] * dt
+        Returns:
+            Tuple of (longitudinal_g, lateral_g, vertical_g, total_g,
+            pitch_deg, roll_deg, yaw_rate_dps)
+        """
+        g = self.read_g_forces()
+        o = self.read_orientation()
+        return (
+            g['longitudinal_g'], g['lateral_g'], g['vertical_g'], g['total_g'],
+            o['pitch_deg'], o['roll_deg'], o['yaw_rate_dps']
+        )
+
+    def read_batch(self, n: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """
+        Read a batch of samples back-to-back and process them as arrays.
 
-        # Complementary filter: combine gyro (short-term) and accel (long-term)
-        self.pitch = self.filter_alpha * gyro_pitch + (1 - self.filter_alpha) * accel_pitch
-        self.roll = self.filter_alpha * gyro_roll + (1 - self.filter_alpha) * accel_roll
+        Offset correction, frame rotation, g-force conversion and tilt are
+        computed over the whole batch with NumPy; only the recurrent
+        complementary filter runs per sample (JIT-compiled with Numba).
+
+        Args:
+            n: Number of samples to read (default: batch_size from config)
+
+        Returns:
+            Dictionary with the same keys as read_all, each an array of n values
+        """
+        n = n or self.batch_size
+        if n != len(self._time_buf):
+            self._accel_buf = np.empty((n, 3), dtype=np.float32)
+            self._gyro_buf = np.empty((n, 3), dtype=np.float32)
+            self._time_buf = np.empty(n, dtype=np.int64)
+            self._dyn_buf = np.empty(n, dtype=np.float32)
+
+        accel_buf = self._accel_buf
+        gyro_buf = self._gyro_buf
+        time_buf = self._time_buf
+
+        for i in range(n):
+            accel_buf[i], gyro_buf[i] = self.read_raw()
+            time_buf[i] = time.monotonic_ns()
+
+        # Offset correction and transform to vehicle frame in one affine step
+        if self._rot_is_identity:
+            accel = accel_buf + self._accel_bias
+            gyro = gyro_buf + self._gyro_bias
+        else:
+            accel = accel_buf @ self.rotation_matrix.T + self._accel_bias
+            gyro = gyro_buf @ self.rotation_matrix.T + self._gyro_bias
+
+        # G-forces
+        g = (accel - self._g_vec) * self._inv_g
+        total_g = np.linalg.norm(g, axis=1)
+
+        # Accelerometer tilt and adaptive filter weight per sample
+        ax, ay, az = accel[:, 0], accel[:, 1], accel[:, 2]
+        accel_pitch = np.arctan2(ax, np.hypot(ay, az))
+        accel_roll = np.arctan2(ay, np.hypot(ax, az))
+        dyn = self._dynamic_accel(accel, self._dyn_buf)
+        base_alpha = self.filter_alpha
+        alpha = np.minimum(1.0, base_alpha + (1 - base_alpha) * dyn / self.dyn_threshold)
+
+        dt = np.diff(time_buf, prepend=self.last_time_ns) * 1e-9
+        self.last_time_ns = int(time_buf[-1])
+
+        pitch, roll = _cf_batch(accel_pitch, accel_roll, gyro[:, 0], gyro[:, 1], dt, alpha,
+                                self.pitch, self.roll)
+        self.pitch = float(pitch[-1])
+        self.roll = float(roll[-1])
 
         return {
-            'pitch_deg': math.degrees(self.pitch),
-            'roll_deg': math.degrees(self.roll),
-            'yaw_rate_dps': math.degrees(gyro[2])
+            'longitudinal_g': g[:, 0],
+            'lateral_g': g[:, 1],
+            'vertical_g': g[:, 2],
+            'total_g': total_g,
+            'pitch_deg': pitch * RAD2DEG,
+            'roll_deg': roll * RAD2DEG,
+            'yaw_rate_dps': gyro[:, 2] * RAD2DEG
         }
 
-    def read_all(self) -> Dict[str, float]:
+    def _dynamic_accel(self, accel: np.ndarray, out: np.ndarray) -> np.ndarray:
         """
-        Read all accelerometer data (g-forces and orientation).
+        Compute |‖a‖ - g| per sample, the input to the adaptive filter weight.
+
+        Uses numexpr when available to evaluate the expression in one fused
+        pass without temporaries.
+
+        Args:
+            accel: Acceleration samples, shape (n, 3), in m/s²
+            out: Preallocated float32 array of length n for the result
 
         Returns:
-            Dictionary with all acceleration and orientation data
+            out, filled with the dynamic acceleration magnitude
         """
-        data = {}
-        data.update(self.read_g_forces())
-        data.update(self.read_orientation())
-        return data
+        if HAS_NUMEXPR:
+            return ne.evaluate(
+                "abs(sqrt(ax*ax + ay*ay + az*az) - G)",
+                local_dict={'ax': accel[:, 0], 'ay': accel[:, 1], 'az': accel[:, 2],
+                            'G': self._g_f32},
+                out=out
+            )
+
+        np.subtract(np.linalg.norm(accel, axis=1), self._g_f32, out=out)
+        return np.abs(out, out=out)
 
     def _get_simulated_values(self) -> Tuple[np.ndarray, np.ndarray]:
         """
@@ -250,42 +524,38 @@ class Accelerometer:
         Returns:
             Tuple of (acceleration, gyro_rate)
         """
-        import random
+        now = time.monotonic_ns()
+        dt = (now - self.sim_time_ns) * 1e-9
+        self.sim_time_ns = now
 
-        current_time = time.time()
-        dt = current_time - self.sim_time
-        self.sim_time = current_time
+        # Noise for accel x/y/z then gyro x/y/z, in [-1, 1)
+        noise = self._noise.take(6)
 
         # Simulate acceleration phases
-        phase = (current_time % 20) / 20  # 20-second cycle
+        phase = (now % 20_000_000_000) / 20e9  # 20-second cycle
+
+        # Default lateral acceleration
+        accel_y = 2.0 * noise[1]
 
         if phase < 0.3:  # Acceleration
-            accel_x = 3.0 + random.uniform(-0.5, 0.5)  # ~0.3g forward
+            accel_x = 3.0 + 0.5 * noise[0]  # ~0.3g forward
             self.sim_speed += accel_x * dt
         elif phase < 0.5:  # Braking
-            accel_x = -5.0 + random.uniform(-1.0, 1.0)  # ~0.5g braking
+            accel_x = -5.0 + noise[0]  # ~0.5g braking
             self.sim_speed = max(0, self.sim_speed + accel_x * dt)
         elif phase < 0.7:  # Cornering
-            accel_x = random.uniform(-2, 2)
-            accel_y = 8.0 + random.uniform(-1, 1)  # ~0.8g lateral
+            accel_x = 2.0 * noise[0]
+            accel_y = 8.0 + noise[1]  # ~0.8g lateral
         else:  # Cruising
-            accel_x = random.uniform(-1, 1)
-            accel_y = random.uniform(-1, 1)
-
-        # Default lateral acceleration
-        if phase >= 0.7 or phase < 0.5:
-            accel_y = random.uniform(-2, 2)
+            accel_x = noise[0]
 
         # Vertical (mostly gravity with small bumps)
-        accel_z = self.GRAVITY + random.uniform(-2, 2)
+        accel_z = self.GRAVITY + 2.0 * noise[2]
 
-        accel = np.array([accel_x, accel_y, accel_z])
+        accel = np.array([accel_x, accel_y, accel_z], dtype=np.float32)
 
-        # Gyroscope (rotation rates)
-        gyro_x = random.uniform(-0.1, 0.1)  # Roll rate
-        gyro_y = random.uniform(-0.1, 0.1)  # Pitch rate
-        gyro_z = random.uniform(-0.2, 0.2)  # Yaw rate
-        gyro = np.array([gyro_x, gyro_y, gyro_z])
+        # Gyroscope (roll, pitch, yaw rates)
+        gyro = noise[3:] * self._sim_gyro_scale
 
         return accel, gyro
 
@@ -301,7 +571,7 @@ class Accelerometer:
             Temperature in Celsius, or None if not available
         """
         if self.simulation_mode:
-            return 25.0 + np.random.uniform(-2, 5)
+            return 26.5 + 3.5 * float(self._noise.take(1)[0])
 
         try:
             if self.sensor:
@@ -6,6 +6,7 @@ Handles NEO-6M GPS module for position, speed, and track logging.
 import logging
 import time
 import math
+import operator
 from typing import Dict, Optional, Tuple, Any
 import random
 
@@ -30,6 +31,10 @@ class GPS:
     # Earth radius in meters (for distance calculations)
     EARTH_RADIUS = 6371000
 
+    # Fields logged by the DAQ, in the order returned by read_tuple()
+    LOGGED_FIELDS = ('latitude', 'longitude', 'altitude_m', 'speed_mph', 'track_deg', 'satellites', 'valid')
+    _logged_values = staticmethod(operator.itemgetter(*LOGGED_FIELDS))
+
     def __init__(self, config: Dict[str, Any], simulation_mode: bool = False):
         """
         Initialize GPS interface.
@@ -126,6 +131,15 @@ class GPS:
             logger.error(f"Error reading GPS: {e}")
             return self._get_invalid_data()
 
+    def read_tuple(self) -> Tuple[Any, ...]:
+        """
+        Read current GPS data as a fixed-order tuple.
+
+        Returns:
+            Tuple of values in LOGGED_FIELDS order
+        """
+        return self._logged_values(self.read())
+
     def get_position(self) -> Tuple[float, float, float]:
         """
         Get current position.
@@ -5,12 +5,62 @@ Handles communication with ELM327 Bluetooth adapter to read vehicle parameters.
 
 import obd
 import logging
-from typing import Dict, Optional, List, Any
+import operator
+import copy
+import numpy as np
+from typing import Dict, Optional, List, Any, Tuple
 import time
-from threading import Lock
+from threading import Lock, Thread, Event
+
+from ._jit import njit
+from ._noise import NoisePool
 
 logger = logging.getLogger(__name__)
 
+# Bound once; OBD responses are pint Quantities, so this is the common path
+_get_magnitude = operator.attrgetter('magnitude')
+
+
+def extract_value(obj: Any) -> Any:
+    """Extract numeric value from OBD response object."""
+    if obj is None:
+        return None
+    try:
+        return _get_magnitude(obj)
+    except AttributeError:
+        return obj
+
+
+@njit(cache=True)
+def _sim_core(rpm: float, speed: float, noise: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """
+    Compute one tick of simulated PID values.
+
+    Args:
+        rpm: Simulated engine speed
+        speed: Simulated vehicle speed
+        noise: 8 uniform draws in [-1, 1)
+        out: Output array laid out as OBDInterface.SIM_PIDS
+
+    Returns:
+        out, filled with the simulated values
+    """
+    out[0] = rpm                                   # RPM
+    out[1] = speed                                 # SPEED
+    out[2] = min(100.0, (rpm - 800.0) / 72.0)      # THROTTLE_POS
+    out[3] = 86.5 + 3.5 * noise[0]                 # COOLANT_TEMP, 83..90
+    out[4] = 35.0 + 10.0 * noise[1]                # INTAKE_TEMP, 25..45
+    out[5] = rpm / 100.0 + 5.0 * noise[2]          # MAF
+    out[6] = min(100.0, rpm / 80.0)                # ENGINE_LOAD
+    out[7] = 18.5 + 6.5 * noise[3]                 # TIMING_ADVANCE, 12..25
+    out[8] = 5.0 * noise[4]                        # SHORT_FUEL_TRIM_1
+    out[9] = 3.0 * noise[5]                        # LONG_FUEL_TRIM_1
+    out[10] = 0.5 + 0.2 * noise[6]                 # O2_B1S1
+    out[11] = 101.3                                # BAROMETRIC_PRESSURE
+    out[12] = 25.0 + rpm / 200.0                   # INTAKE_PRESSURE
+    out[13] = 300.0 + 10.0 * noise[7]              # FUEL_PRESSURE
+    return out
+
 
 class OBDInterface:
     """
@@ -20,6 +70,28 @@ class OBDInterface:
     both synchronous and asynchronous data retrieval with priority-based polling.
     """
 
+    # Mode 01 allows up to 6 PIDs in one request
+    MAX_PIDS_PER_REQUEST = 6
+
+    # PIDs logged by the DAQ, in the order returned by read_all_pids_tuple()
+    LOGGED_PIDS = (
+        'RPM', 'SPEED', 'THROTTLE_POS', 'COOLANT_TEMP', 'INTAKE_TEMP',
+        'MAF', 'ENGINE_LOAD', 'TIMING_ADVANCE', 'SHORT_FUEL_TRIM_1', 'LONG_FUEL_TRIM_1'
+    )
+
+    # Numeric PIDs produced by _sim_core, in output order
+    SIM_PIDS = (
+        'RPM', 'SPEED', 'THROTTLE_POS', 'COOLANT_TEMP', 'INTAKE_TEMP',
+        'MAF', 'ENGINE_LOAD', 'TIMING_ADVANCE', 'SHORT_FUEL_TRIM_1',
+        'LONG_FUEL_TRIM_1', 'O2_B1S1', 'BAROMETRIC_PRESSURE',
+        'INTAKE_PRESSURE', 'FUEL_PRESSURE'
+    )
+    # Non-numeric simulated PIDs
+    SIM_CONSTANTS = {'FUEL_STATUS': 'Closed loop'}
+
+    # Simulated values are regenerated at most this often
+    SIM_TICK_NS = 10_000_000
+
     def __init__(self, config: Dict[str, Any], simulation_mode: bool = False):
         """
         Initialize OBD-II interface.
@@ -33,13 +105,51 @@ class OBDInterface:
         self.connection: Optional[obd.OBD] = None
         self.supported_pids: List[str] = []
         self.last_values: Dict[str, Any] = {}
+        # PID name -> time.monotonic() of its last successful read
+        self.last_times: Dict[str, float] = {}
         self.lock = Lock()
         self.connected = False
 
+        # Background polling: fast and slow PIDs refresh last_values on their
+        # own threads. The adapter handles one request at a time, so queries
+        # are serialized with _io_lock.
+        self._io_lock = Lock()
+        self._stop_polling = Event()
+        self._poll_threads: List[Thread] = []
+
+        # Polled values older than stale_after_periods poll periods are
+        # reported as None (max age per PID set in _start_polling)
+        self._max_age: Dict[str, float] = {}
+        self._default_max_age = float('inf')
+
+        # Multi-PID commands keyed by PID tuple (built in _query_supported_pids)
+        self._multi_cmds: Dict[Tuple[str, ...], List[Tuple[obd.OBDCommand, List[str]]]] = {}
+
+        # PID name -> OBDCommand (None for unknown names), filled at connect
+        self._cmd_cache: Dict[str, Optional[obd.OBDCommand]] = {}
+
+        # Multi-PID requests are given up on only after this many misses in
+        # a row, so one dropped response (common at key-on) doesn't disable them
+        self._multi_pid_ok = True
+        self._multi_failures = 0
+        self._multi_max_failures = config.get('multi_pid_max_failures', 3)
+
+        # Polling groups, fixed for the life of the interface
+        self._fast_pids = tuple(config.get('fast_pids', ['RPM', 'SPEED', 'THROTTLE_POS']))
+        self._slow_pids = tuple(config.get('slow_pids', []))
+
         # Simulated values for testing
         self.sim_rpm = 800
         self.sim_speed = 0
-        self.sim_time = time.time()
+        self.sim_time_ns = time.monotonic_ns()
+        # float64 so logged values are not float32 round-offs (89.41938018798828)
+        self._noise = NoisePool(dtype=np.float64)
+
+        # One tick of simulated values, indexed via _pid_index
+        self._pid_index = {name: i for i, name in enumerate(self.SIM_PIDS)}
+        self._sim_buf = np.zeros(len(self.SIM_PIDS))
+        self._last_sim: List[float] = self._sim_buf.tolist()
+        self._sim_tick(self.sim_time_ns)
 
     def connect(self) -> bool:
         """
@@ -52,6 +162,7 @@ class OBDInterface:
             logger.info("OBD-II: Running in simulation mode")
             self.connected = True
             self._setup_simulated_pids()
+            self._start_polling()
             return True
 
         try:
@@ -65,6 +176,7 @@ class OBDInterface:
                 logger.info(f"OBD-II connected: {self.connection.port_name()}")
                 self._query_supported_pids()
                 self.connected = True
+                self._start_polling()
                 return True
             else:
                 logger.error("Failed to connect to OBD-II adapter")
@@ -76,11 +188,56 @@ class OBDInterface:
 
     def disconnect(self):
         """Close OBD-II connection."""
+        self._stop_polling.set()
+        for thread in self._poll_threads:
+            thread.join(timeout=5)
+        self._poll_threads = []
+
         if self.connection and not self.simulation_mode:
             self.connection.close()
             logger.info("OBD-II disconnected")
         self.connected = False
 
+    def _start_polling(self):
+        """Start fast/slow PID polling threads if enabled in config."""
+        if not self.config.get('background_polling', True):
+            return
+
+        fast_period = 1.0 / self.config.get('poll_rate_hz', 10)
+        slow_period = 1.0 / self.config.get('slow_poll_rate_hz', 1)
+
+        periods = self.config.get('stale_after_periods', 3)
+        self._default_max_age = periods * slow_period
+        self._max_age = dict.fromkeys(self._slow_pids, periods * slow_period)
+        self._max_age.update(dict.fromkeys(self._fast_pids, periods * fast_period))
+
+        self._stop_polling.clear()
+        self._poll_threads = [
+            Thread(target=self._poll_loop, args=(self.read_all_fast_pids, fast_period),
+                   name="obd-fast", daemon=True),
+            Thread(target=self._poll_loop, args=(self.read_all_slow_pids, slow_period),
+                   name="obd-slow", daemon=True)
+        ]
+        for thread in self._poll_threads:
+            thread.start()
+
+    def _poll_loop(self, read, period: float):
+        """
+        Poll a group of PIDs into last_values until disconnect.
+
+        Args:
+            read: Method returning a dict of PID values
+            period: Seconds between polls
+        """
+        while not self._stop_polling.is_set():
+            start = time.monotonic()
+            try:
+                self._store_values(read())
+            except Exception as e:
+                logger.error(f"OBD polling error: {e}")
+
+            self._stop_polling.wait(max(0, period - (time.monotonic() - start)))
+
     def _query_supported_pids(self):
         """Query which PIDs are supported by the vehicle."""
         if self.simulation_mode:
@@ -95,6 +252,99 @@ class OBDInterface:
         logger.info(f"Found {len(self.supported_pids)} supported PIDs")
         logger.debug(f"Supported PIDs: {self.supported_pids}")
 
+        # Resolve configured PID commands once
+        for name in set(self._fast_pids) | set(self._slow_pids):
+            self._get_command(name)
+
+        # Prebuild multi-PID commands for the polling groups
+        for pids in (self._fast_pids, self._slow_pids):
+            self._multi_cmds[pids] = self._build_multi_commands(pids)
+
+    def _get_command(self, pid_name: str) -> Optional[obd.OBDCommand]:
+        """
+        Look up an OBD command by PID name, caching the result.
+
+        Args:
+            pid_name: Name of the PID (e.g., 'RPM')
+
+        Returns:
+            OBDCommand, or None if the name is unknown
+        """
+        if pid_name in self._cmd_cache:
+            return self._cmd_cache[pid_name]
+
+        cmd = obd.commands[pid_name] if obd.commands.has_name(pid_name) else None
+        if cmd is None:
+            logger.warning(f"Unknown PID: {pid_name}")
+        self._cmd_cache[pid_name] = cmd
+        return cmd
+
+    def _build_multi_commands(self, pids: Tuple[str, ...]) -> List[Tuple[obd.OBDCommand, List[str]]]:
+        """
+        Build mode 01 commands that request several PIDs at once.
+
+        Args:
+            pids: PID names to group
+
+        Returns:
+            List of (command, PID names) with at most MAX_PIDS_PER_REQUEST each
+        """
+        cmds = []
+        for name in pids:
+            cmd = self._get_command(name)
+            if cmd is None or cmd.command[:2] != b"01":
+                logger.warning(f"PID {name} cannot be batched - skipping in multi-PID request")
+                continue
+            cmds.append(cmd)
+
+        groups = []
+        for i in range(0, len(cmds), self.MAX_PIDS_PER_REQUEST):
+            group = cmds[i:i + self.MAX_PIDS_PER_REQUEST]
+            names = [cmd.name for cmd in group]
+            multi_cmd = obd.OBDCommand(
+                "MULTI_" + "_".join(names),
+                "Multi-PID request: " + ", ".join(names),
+                b"01" + b"".join(cmd.command[2:] for cmd in group),
+                0,  # Variable length - decoder splits the payload
+                self._make_multi_decoder(group)
+            )
+            groups.append((multi_cmd, names))
+
+        return groups
+
+    @staticmethod
+    def _make_multi_decoder(cmds: List[obd.OBDCommand]):
+        """
+        Create a decoder that splits a multi-PID response per PID.
+
+        The response data is the mode byte followed by (PID, payload) pairs.
+        Each payload is decoded with the single-PID command's own decoder.
+
+        Args:
+            cmds: Commands in the request
+
+        Returns:
+            Decoder returning a dict of PID name to value
+        """
+        by_pid = {int(cmd.command[2:4], 16): cmd for cmd in cmds}
+
+        def decode(messages):
+            data = messages[0].data
+            values = {}
+            i = 1  # Skip mode byte (0x41)
+            while i < len(data):
+                cmd = by_pid.get(data[i])
+                if cmd is None:  # Trailing padding
+                    break
+                n = cmd.bytes - 2  # Payload length without mode/PID bytes
+                msg = copy.copy(messages[0])
+                msg.data = bytearray([0x41, data[i]]) + data[i + 1:i + 1 + n]
+                values[cmd.name] = cmd.decoder([msg])
+                i += 1 + n
+            return values
+
+        return decode
+
     def _setup_simulated_pids(self):
         """Set up list of simulated PIDs for testing."""
         self.supported_pids = [
@@ -120,72 +370,149 @@ class OBDInterface:
         if self.simulation_mode:
             return self._get_simulated_value(pid_name)
 
+        cmd = self._cmd_cache.get(pid_name) or self._get_command(pid_name)
+        if cmd is None:
+            return None
+
         try:
-            cmd = obd.commands[pid_name]
-            response = self.connection.query(cmd)
+            with self._io_lock:
+                response = self.connection.query(cmd)
 
             if response.is_null():
                 return None
 
             # Store last value
-            with self.lock:
-                self.last_values[pid_name] = response.value
+            self._store_values({pid_name: response.value})
 
             return response.value
 
-        except KeyError:
-            logger.warning(f"Unknown PID: {pid_name}")
-            return None
         except Exception as e:
             logger.error(f"Error reading {pid_name}: {e}")
             return None
 
-    def read_all_fast_pids(self) -> Dict[str, Any]:
+    def read_multi(self, pids: List[str]) -> Dict[str, Any]:
         """
-        Read all fast-polling PIDs (RPM, speed, throttle).
+        Read several PIDs with one request per group of up to 6.
+
+        Falls back to single-PID reads when a multi-PID request goes
+        unanswered, and for good once multi_pid_max_failures requests in a
+        row have failed (the adapter or protocol does not support them).
+
+        Args:
+            pids: PID names to read
 
         Returns:
-            Dictionary of PID values
+            Dictionary of PID values (PIDs that failed are omitted)
         """
-        fast_pids = self.config.get('fast_pids', ['RPM', 'SPEED', 'THROTTLE_POS'])
-        data = {}
+        if self.simulation_mode or not self._multi_pid_ok:
+            return self._read_each(pids)
 
-        for pid in fast_pids:
-            value = self.read_pid(pid)
-            if value is not None:
-                data[pid] = value
+        key = tuple(pids)
+        groups = self._multi_cmds.get(key)
+        if groups is None:
+            groups = self._multi_cmds[key] = self._build_multi_commands(key)
+
+        data = {}
+        for multi_cmd, names in groups:
+            try:
+                with self._io_lock:
+                    response = self.connection.query(multi_cmd, force=True)
+                values = None if response.is_null() else response.value
+            except Exception as e:
+                logger.debug(f"Multi-PID request failed: {e}")
+                values = None
+
+            if values is None:
+                self._multi_failures += 1
+                if self._multi_failures >= self._multi_max_failures:
+                    logger.warning("Multi-PID requests not supported - using single-PID reads")
+                    self._multi_pid_ok = False
+                return self._read_each(pids)
+
+            for name, value in values.items():
+                if value is not None:
+                    data[name] = value
+
+        self._multi_failures = 0
+        self._store_values(data)
+
+        # PIDs that could not be batched are read individually
+        batched = {name for _, names in groups for name in names}
+        data.update(self._read_each([pid for pid in pids if pid not in batched]))
 
         return data
 
-    def read_all_slow_pids(self) -> Dict[str, Any]:
+    def _store_values(self, data: Dict[str, Any]):
         """
-        Read all slow-polling PIDs (temperatures, fuel trim, etc.).
+        Record PID values in last_values with the time they were read.
+
+        Args:
+            data: Dictionary of PID values
+        """
+        now = time.monotonic()
+        with self.lock:
+            self.last_values.update(data)
+            self.last_times.update(dict.fromkeys(data, now))
+
+    def _read_each(self, pids: List[str]) -> Dict[str, Any]:
+        """Read PIDs one request at a time."""
+        return {pid: value for pid in pids if (value := self.read_pid(pid)) is not None}
+
+    def read_all_fast_pids(self) -> Dict[str, Any]:
+        """
+        Read all fast-polling PIDs (RPM, speed, throttle).
 
         Returns:
             Dictionary of PID values
         """
-        slow_pids = self.config.get('slow_pids', [])
-        data = {}
+        return self.read_multi(self._fast_pids)
 
-        for pid in slow_pids:
-            value = self.read_pid(pid)
-            if value is not None:
-                data[pid] = value
+    def read_all_slow_pids(self) -> Dict[str, Any]:
+        """
+        Read all slow-polling PIDs (temperatures, fuel trim, etc.).
 
-        return data
+        Returns:
+            Dictionary of PID values
+        """
+        return self.read_multi(self._slow_pids)
 
     def read_all_pids(self) -> Dict[str, Any]:
         """
         Read all configured PIDs.
 
+        With background polling running this is a snapshot of the latest
+        polled values and does not touch the adapter. Values not refreshed
+        within stale_after_periods poll periods (e.g. the adapter stopped
+        answering) are returned as None.
+
         Returns:
             Dictionary of all PID values
         """
+        if self._poll_threads:
+            now = time.monotonic()
+            max_age = self._max_age
+            default = self._default_max_age
+            with self.lock:
+                return {
+                    pid: value if now - self.last_times[pid] <= max_age.get(pid, default) else None
+                    for pid, value in self.last_values.items()
+                }
+
         data = {}
         data.update(self.read_all_fast_pids())
         data.update(self.read_all_slow_pids())
         return data
 
+    def read_all_pids_tuple(self) -> Tuple[Any, ...]:
+        """
+        Read all configured PIDs as plain values in LOGGED_PIDS order.
+
+        Returns:
+            Tuple of PID magnitudes, None for PIDs that were not read
+        """
+        data = self.read_all_pids()
+        return tuple(map(extract_value, map(data.get, self.LOGGED_PIDS)))
+
     def get_dtcs(self) -> List[str]:
         """
         Get diagnostic trouble codes.
@@ -197,7 +524,8 @@ class OBDInterface:
             return []
 
         try:
-            response = self.connection.query(obd.commands.GET_DTC)
+            with self._io_lock:
+                response = self.connection.query(obd.commands.GET_DTC)
             if not response.is_null():
                 return [dtc[0] for dtc in response.value]
             return []
@@ -216,7 +544,8 @@ class OBDInterface:
             return False
 
         try:
-            response = self.connection.query(obd.commands.CLEAR_DTC)
+            with self._io_lock:
+                response = self.connection.query(obd.commands.CLEAR_DTC)
             return not response.is_null()
         except Exception as e:
             logger.error(f"Error clearing DTCs: {e}")
@@ -232,42 +561,41 @@ class OBDInterface:
         Returns:
             Simulated value
         """
-        import random
+        now = time.monotonic_ns()
+        if now - self.sim_time_ns >= self.SIM_TICK_NS:
+            # Both poll threads get here; only one may advance the simulation
+            with self._io_lock:
+                if now - self.sim_time_ns >= self.SIM_TICK_NS:
+                    self._sim_tick(now)
+
+        idx = self._pid_index.get(pid_name)
+        if idx is not None:
+            return self._last_sim[idx]
+        return self.SIM_CONSTANTS.get(pid_name, 0)
+
+    def _sim_tick(self, now: int):
+        """
+        Advance the simulation and regenerate all simulated PID values.
+
+        Args:
+            now: Current time from time.monotonic_ns()
+        """
+        self.sim_time_ns = now
 
-        # Update simulation state
-        dt = time.time() - self.sim_time
-        self.sim_time = time.time()
+        # noise[0:8] feeds _sim_core, noise[8:10] drives the RPM random walk
+        noise = self._noise.take(10)
 
         # Simulate acceleration/deceleration
-        if random.random() < 0.1:  # 10% chance to change
-            self.sim_rpm += random.randint(-200, 500)
+        if noise[8] < -0.8:  # 10% chance to change
+            self.sim_rpm += int(150 + 350 * noise[9])  # -200..+500
             self.sim_rpm = max(800, min(8000, self.sim_rpm))
 
             # Speed follows RPM roughly
-            gear_ratio = 3.0  # Simplified
             self.sim_speed = (self.sim_rpm / 1000) * 10
             self.sim_speed = max(0, min(155, self.sim_speed))
 
-        # Simulation values - return appropriate types/units
-        simulations = {
-            'RPM': self.sim_rpm,
-            'SPEED': self.sim_speed,
-            'THROTTLE_POS': min(100, (self.sim_rpm - 800) / 72),
-            'COOLANT_TEMP': 85 + random.uniform(-2, 5),
-            'INTAKE_TEMP': 30 + random.uniform(-5, 15),
-            'MAF': (self.sim_rpm / 100) + random.uniform(-5, 5),
-            'ENGINE_LOAD': min(100, (self.sim_rpm / 80)),
-            'TIMING_ADVANCE': 15 + random.uniform(-3, 10),
-            'SHORT_FUEL_TRIM_1': random.uniform(-5, 5),
-            'LONG_FUEL_TRIM_1': random.uniform(-3, 3),
-            'O2_B1S1': 0.5 + random.uniform(-0.2, 0.2),
-            'FUEL_STATUS': 'Closed loop',
-            'BAROMETRIC_PRESSURE': 101.3,
-            'INTAKE_PRESSURE': 25 + (self.sim_rpm / 200),
-            'FUEL_PRESSURE': 300 + random.uniform(-10, 10)
-        }
-
-        return simulations.get(pid_name, 0)
+        _sim_core(float(self.sim_rpm), float(self.sim_speed), noise, self._sim_buf)
+        self._last_sim = self._sim_buf.tolist()
 
     def is_connected(self) -> bool:
         """Check if OBD-II is connected."""
@@ -3,20 +3,54 @@ Temperature Sensor Module
 Handles DS18B20 1-Wire temperature sensors for monitoring oil, intake, brake, transmission temps.
 """
 
+import asyncio
 import logging
+import os
 import time
 import glob
-from typing import Dict, List, Optional, Any
-import random
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
-try:
-    from w1thermsensor import W1ThermSensor, Sensor
-    HAS_W1 = True
-except ImportError:
-    HAS_W1 = False
-    logger.warning("w1thermsensor not available - will run in simulation mode")
+# Linux w1 sysfs tree (w1-gpio / w1_therm kernel modules)
+W1_DEVICES_DIR = '/sys/bus/w1/devices'
+
+# 1-Wire thermometer family codes (device IDs start with "<code>-") that
+# the w1_therm driver supports; all report "t=<millidegrees C>" in w1_slave
+W1_THERM_FAMILIES = {
+    '10': 'DS18S20',
+    '22': 'DS1822',
+    '28': 'DS18B20',
+    '3b': 'MAX31850',
+    '42': 'DS28EA00',
+}
+
+# Families with a programmable 9-12 bit resolution; the others convert at
+# a fixed resolution in up to MAX_CONVERSION_TIME
+ADJUSTABLE_RESOLUTION_FAMILIES = {'22', '28', '42'}
+
+HAS_W1 = os.path.isdir(W1_DEVICES_DIR)
+if not HAS_W1:
+    logger.warning("1-Wire sysfs not available - will run in simulation mode")
+
+# DS18B20 worst-case conversion time at 12-bit resolution (seconds)
+MAX_CONVERSION_TIME = 0.75
+
+# DS18B20 conversion time per resolution in bits (seconds); each bit less
+# halves the time and doubles the step size (12-bit = 0.0625 °C)
+CONVERSION_TIME = {9: 0.09375, 10: 0.1875, 11: 0.375, 12: 0.75}
+
+# Wait before re-reading a sensor whose scratchpad failed the CRC (seconds)
+CRC_RETRY_DELAY = 0.02
+
+# w1_slave is two lines, 76 bytes at most:
+#   "72 01 4b 46 7f ff 0e 10 57 : crc=57 YES\n"  (40 bytes)
+#   "72 01 4b 46 7f ff 0e 10 57 t=25062\n"       (35-36 bytes for t=-55000..125000)
+# Reading 128 leaves headroom for driver variations so a reading is never
+# truncated by the single pread
+W1_SLAVE_READ_SIZE = 128
 
 
 class TemperatureSensors:
@@ -41,6 +75,43 @@ class TemperatureSensors:
         self.sensor_config = config.get('sensors', {})
         self.connected = False
 
+        # Worker threads for concurrent 1-Wire reads (hardware mode only)
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+        # w1_therm bulk-read trigger files, one per bus master (found at connect)
+        self._bulk_paths: List[str] = []
+
+        # sensor_id -> w1_slave path (found at connect)
+        self._sysfs_paths: Dict[str, str] = {}
+
+        # sensor_id -> w1_slave file descriptor, kept open and read with
+        # pread at offset 0 (which makes the driver produce a fresh reading)
+        self._fds: Dict[str, int] = {}
+
+        # (sensor_id, name, w1_slave fd) per sensor, for the read loops
+        self._read_list: List[Tuple[str, str, Optional[int]]] = []
+
+        # Last full sweep in _read_list order, °F with NaN for failed reads
+        self._temps_f = np.empty(0)
+
+        # Sensor metadata as parallel arrays in _read_list order (built at
+        # connect), with sensor_id -> index
+        self._ids = np.empty(0, dtype=object)
+        self._names = np.empty(0, dtype=object)
+        self._locations = np.empty(0, dtype=object)
+        self._warn = np.empty(0)
+        self._crit = np.empty(0)
+        self._id_to_idx: Dict[str, int] = {}
+
+        # Recent readings: sensor_id -> (monotonic time, temp_f). DS18B20
+        # values can't change meaningfully faster than this.
+        self._cache: Dict[str, Tuple[float, Optional[float]]] = {}
+        self._cache_ttl = config.get('cache_ttl_seconds', 0.5)
+
+        # Lower resolution converts faster; 10-bit (0.25 °C) is plenty here
+        self.resolution_bits = config.get('resolution_bits', 10)
+        self._conversion_time = MAX_CONVERSION_TIME
+
         # Simulation state
         self.sim_temps = {
             'engine_oil': 190.0,
@@ -49,6 +120,10 @@ class TemperatureSensors:
             'transmission': 195.0,
             'ambient': 75.0
         }
+        self._rng = np.random.default_rng()
+        self._sim_names: List[str] = []
+        self._sim_index: Dict[str, int] = {}
+        self._sim_base = np.empty(0)
 
     def connect(self) -> bool:
         """
@@ -64,11 +139,19 @@ class TemperatureSensors:
             return True
 
         try:
-            # Discover all DS18B20 sensors on the 1-Wire bus
-            discovered = W1ThermSensor.get_available_sensors([Sensor.DS18B20])
+            # Discover all thermometers on every 1-Wire bus master
+            discovered = []
+            for device_id in sorted({
+                os.path.basename(path) for path in
+                glob.glob(f"{W1_DEVICES_DIR}/w1_bus_master*/*-*")
+            }):
+                if device_id.split('-', 1)[0].lower() in W1_THERM_FAMILIES:
+                    discovered.append(device_id)
+                else:
+                    logger.info(f"Skipping 1-Wire device {device_id}: not a supported thermometer")
 
             if not discovered:
-                logger.warning("No DS18B20 sensors found")
+                logger.warning("No 1-Wire temperature sensors found")
                 logger.info("Make sure 1-Wire is enabled: add 'dtoverlay=w1-gpio' to /boot/config.txt")
                 self.simulation_mode = True
                 self._setup_simulated_sensors()
@@ -76,15 +159,19 @@ class TemperatureSensors:
                 return True
 
             # Map discovered sensors to configured names
-            for sensor in discovered:
-                sensor_id = sensor.id
+            for sensor_id in discovered:
                 logger.debug(f"Found sensor: {sensor_id}")
+                path = f"{W1_DEVICES_DIR}/{sensor_id}/w1_slave"
+                self._sysfs_paths[sensor_id] = path
+                try:
+                    self._fds[sensor_id] = os.open(path, os.O_RDONLY)
+                except OSError as e:
+                    logger.error(f"Cannot open {path}: {e}")
 
                 # Check if this sensor is in our configuration
                 if sensor_id in self.sensor_config:
                     config = self.sensor_config[sensor_id]
                     self.sensors[sensor_id] = {
-                        'sensor': sensor,
                         'name': config['name'],
                         'location': config['location'],
                         'warning_threshold': config.get('warning_threshold_f', 999),
@@ -92,10 +179,13 @@ class TemperatureSensors:
                     }
                     logger.info(f"Registered sensor {config['name']}: {sensor_id}")
                 else:
-                    # Unknown sensor - add with generic name
+                    # Unknown sensor - add with generic name, falling back to
+                    # the full ID if another sensor already has the short one
+                    name = f'unknown_{sensor_id[:8]}'
+                    if any(info['name'] == name for info in self.sensors.values()):
+                        name = f'unknown_{sensor_id}'
                     self.sensors[sensor_id] = {
-                        'sensor': sensor,
-                        'name': f'unknown_{sensor_id[:8]}',
+                        'name': name,
                         'location': 'Unknown',
                         'warning_threshold': 999,
                         'critical_threshold': 999
@@ -103,6 +193,19 @@ class TemperatureSensors:
                     logger.warning(f"Unknown sensor found: {sensor_id} - add to config to name it")
 
             logger.info(f"Temperature sensors connected: {len(self.sensors)} sensors")
+            self._build_read_list()
+            self._set_resolution(self.resolution_bits)
+
+            # Each read blocks on the bus for the conversion, so read all
+            # sensors at once rather than one after another
+            if self.sensors:
+                self._pool = ThreadPoolExecutor(max_workers=len(self.sensors),
+                                                thread_name_prefix='w1-read')
+
+            # Newer w1_therm modules can start a conversion on every sensor at once
+            self._bulk_paths = sorted(glob.glob(f"{W1_DEVICES_DIR}/w1_bus_master*/therm_bulk_read"))
+            if self._bulk_paths:
+                logger.info("1-Wire bulk conversion available")
             self.connected = True
             return len(self.sensors) > 0
 
@@ -117,17 +220,79 @@ class TemperatureSensors:
         """Set up simulated sensors for testing."""
         for sensor_id, config in self.sensor_config.items():
             self.sensors[sensor_id] = {
-                'sensor': None,
                 'name': config['name'],
                 'location': config['location'],
                 'warning_threshold': config.get('warning_threshold_f', 999),
                 'critical_threshold': config.get('critical_threshold_f', 999)
             }
 
+        # Per-sensor simulation state as arrays, in self.sensors order
+        self._sim_names = [info['name'] for info in self.sensors.values()]
+        self._sim_index = {name: i for i, name in enumerate(self._sim_names)}
+        self._sim_base = np.array([self.sim_temps.get(name, 100.0) for name in self._sim_names])
+        self._build_read_list()
+
+    def _set_resolution(self, bits: int):
+        """
+        Set the conversion resolution of every sensor that supports it.
+
+        The setting is written to the sensor's EEPROM only if it differs,
+        so reconnecting doesn't wear the EEPROM. The bulk conversion wait is
+        shortened to match if every sensor accepted it.
+
+        Args:
+            bits: Resolution in bits (9-12)
+        """
+        if bits not in CONVERSION_TIME:
+            logger.warning(f"Invalid DS18B20 resolution {bits} bits - leaving sensors unchanged")
+            return
+
+        all_set = True
+        for sensor_id in self.sensors:
+            if sensor_id.split('-', 1)[0].lower() not in ADJUSTABLE_RESOLUTION_FAMILIES:
+                all_set = False  # Fixed resolution, keep the worst-case wait
+                continue
+
+            device_dir = f"{W1_DEVICES_DIR}/{sensor_id}"
+            try:
+                with open(f"{device_dir}/resolution") as f:
+                    if int(f.read()) == bits:
+                        continue
+
+                with open(f"{device_dir}/resolution", 'w') as f:
+                    f.write(str(bits))
+                # Copy the scratchpad to EEPROM so the setting survives power-off
+                with open(f"{device_dir}/eeprom_cmd", 'w') as f:
+                    f.write('save')
+                logger.info(f"Set {sensor_id} to {bits}-bit resolution")
+
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not set resolution of {sensor_id}: {e}")
+                all_set = False
+
+        self._conversion_time = CONVERSION_TIME[bits] if all_set else MAX_CONVERSION_TIME
+
+    def _build_read_list(self):
+        """Flatten self.sensors into the (id, name, fd) list used by read loops."""
+        self._read_list = [
+            (sensor_id, info['name'], self._fds.get(sensor_id))
+            for sensor_id, info in self.sensors.items()
+        ]
+        infos = self.sensors.values()
+        self._ids = np.array(list(self.sensors), dtype=object)
+        self._names = np.array([info['name'] for info in infos], dtype=object)
+        self._locations = np.array([info['location'] for info in infos], dtype=object)
+        self._warn = np.array([info['warning_threshold'] for info in infos], dtype=np.float64)
+        self._crit = np.array([info['critical_threshold'] for info in infos], dtype=np.float64)
+        self._id_to_idx = {sensor_id: i for i, sensor_id in enumerate(self.sensors)}
+
     def read_sensor(self, sensor_id: str, retries: int = 3) -> Optional[float]:
         """
         Read temperature from a specific sensor.
 
+        Readings younger than cache_ttl_seconds are returned from the cache
+        instead of going back to the bus.
+
         Args:
             sensor_id: Sensor ID to read
             retries: Number of retries if read fails
@@ -135,84 +300,300 @@ class TemperatureSensors:
         Returns:
             Temperature in Fahrenheit, or None if failed
         """
-        if sensor_id not in self.sensors:
+        if sensor_id not in self._id_to_idx:
             logger.warning(f"Unknown sensor ID: {sensor_id}")
             return None
 
+        now = time.monotonic()
+        cached = self._cache.get(sensor_id)
+        if cached is not None and now - cached[0] < self._cache_ttl:
+            return cached[1]
+
+        temp = self._read_sensor_uncached(sensor_id, retries)
+        self._cache[sensor_id] = (now, temp)
+        return temp
+
+    def _read_sensor_uncached(self, sensor_id: str, retries: int = 3) -> Optional[float]:
+        """
+        Read temperature from a specific sensor, bypassing the cache.
+
+        Args:
+            sensor_id: Sensor ID to read
+            retries: Number of retries if read fails
+
+        Returns:
+            Temperature in Fahrenheit, or None if failed
+        """
         if self.simulation_mode:
-            sensor_info = self.sensors[sensor_id]
-            name = sensor_info['name']
-            return self._get_simulated_temp(name)
+            return self._get_simulated_temp(self._names[self._id_to_idx[sensor_id]])
 
-        sensor_info = self.sensors[sensor_id]
-        sensor = sensor_info['sensor']
+        return self._read_sensor_fd(sensor_id, self._fds.get(sensor_id), retries)
 
-        for attempt in range(retries):
-            try:
-                # Read temperature in Celsius
-                temp_c = sensor.get_temperature()
+    def _read_sensor_fd(self, sensor_id: str, fd: Optional[int], retries: int = 3) -> Optional[float]:
+        """
+        Read a sensor's w1_slave file, retrying on CRC errors.
+
+        Only a failed CRC (line 1 ending in NO) is retried; I/O errors and
+        unparseable output point at wiring or driver faults and fail at once.
 
-                # Convert to Fahrenheit
-                temp_f = (temp_c * 9/5) + 32
+        Args:
+            sensor_id: Sensor ID (for log messages)
+            fd: Open descriptor of the sensor's w1_slave file
+            retries: Number of attempts if the CRC check fails
 
+        Returns:
+            Temperature in Fahrenheit, or None if failed
+        """
+        if fd is None:
+            return None
+
+        for attempt in range(retries):
+            try:
+                # Reading w1_slave runs a conversion and returns the scratchpad
+                data = os.pread(fd, W1_SLAVE_READ_SIZE, 0)
+            except OSError as e:
+                logger.error(f"Failed to read sensor {sensor_id}: {e}")
+                return None
+
+            if self._crc_ok(data):
+                temp_f = self._parse_w1_slave(data)
+                if temp_f is None:
+                    logger.error(f"Failed to read sensor {sensor_id}: no temperature in w1_slave")
                 return temp_f
 
-            except Exception as e:
-                if attempt < retries - 1:
-                    logger.debug(f"Sensor read failed (attempt {attempt+1}/{retries}): {e}")
-                    time.sleep(0.1)
-                else:
-                    logger.error(f"Failed to read sensor {sensor_id}: {e}")
-                    return None
+            logger.debug(f"CRC error on {sensor_id} (attempt {attempt+1}/{retries})")
+            if attempt < retries - 1:
+                time.sleep(CRC_RETRY_DELAY)
 
+        logger.error(f"Failed to read sensor {sensor_id}: CRC error on {retries} attempts")
         return None
 
     def read_all(self) -> Dict[str, Optional[float]]:
         """
         Read all temperature sensors.
 
+        On hardware the sensors are read concurrently, so the total time is
+        roughly that of the slowest sensor rather than the sum.
+
         Returns:
             Dictionary mapping sensor names to temperatures in Fahrenheit
         """
-        temps = {}
+        cached = self._get_cached_all()
+        if cached is not None:
+            return cached
 
-        for sensor_id, sensor_info in self.sensors.items():
-            name = sensor_info['name']
-            temp = self.read_sensor(sensor_id)
-            temps[name] = temp
+        if self.simulation_mode:
+            return self._finish_sweep(self._get_simulated_temps_vec())
+
+        if self._bulk_paths:
+            temps = self._bulk_convert_and_read()
+            if temps is not None:
+                return temps
+
+        if self._pool is None:
+            results = [self._read_sensor_fd(sensor_id, fd)
+                       for sensor_id, _, fd in self._read_list]
+        else:
+            futures = [self._pool.submit(self._read_sensor_fd, sensor_id, fd)
+                       for sensor_id, _, fd in self._read_list]
+            results = [future.result() for future in futures]
+
+        return self._finish_sweep(np.array(results, dtype=np.float64))
+
+    def _finish_sweep(self, temps_f: np.ndarray) -> Dict[str, Optional[float]]:
+        """
+        Store a full sweep and convert it to the public dict form.
+
+        Args:
+            temps_f: Temperatures in °F in _read_list order, NaN for failures
 
+        Returns:
+            Dictionary mapping sensor names to temperatures (None for failures)
+        """
+        self._temps_f = temps_f
+        now = time.monotonic()
+        temps = {}
+        for (sensor_id, name, _), temp in zip(self._read_list, temps_f.tolist()):
+            if temp != temp:  # NaN
+                temp = None
+            self._cache[sensor_id] = (now, temp)
+            temps[name] = temp
         return temps
 
-    def check_thresholds(self) -> Dict[str, List[str]]:
+    async def read_all_async(self) -> Dict[str, Optional[float]]:
         """
-        Check all sensors against warning/critical thresholds.
+        Read all temperature sensors without blocking the event loop.
+
+        The blocking 1-Wire reads run in a worker thread.
 
         Returns:
-            Dictionary with 'warnings' and 'critical' lists of sensor names
+            Dictionary mapping sensor names to temperatures in Fahrenheit
         """
-        warnings = []
-        critical = []
+        return await asyncio.to_thread(self.read_all)
 
-        temps = self.read_all()
+    def _bulk_convert_and_read(self) -> Optional[Dict[str, Optional[float]]]:
+        """
+        Convert on all sensors with one bus command, then read every result.
 
-        for sensor_id, sensor_info in self.sensors.items():
-            name = sensor_info['name']
-            temp = temps.get(name)
+        Writing "trigger" to therm_bulk_read makes the bus master issue
+        SKIP ROM + CONVERT T, so all sensors convert in the same window.
+        The w1_slave files then return the stored result without starting
+        another conversion.
 
-            if temp is None:
-                continue
+        Returns:
+            Dictionary mapping sensor names to temperatures in Fahrenheit,
+            or None if the bulk conversion could not be started
+        """
+        try:
+            for path in self._bulk_paths:
+                with open(path, 'w') as f:
+                    f.write('trigger')
+        except OSError as e:
+            logger.warning(f"1-Wire bulk conversion failed ({e}) - using per-sensor reads")
+            self._bulk_paths = []
+            return None
 
-            # Check thresholds
-            if temp >= sensor_info['critical_threshold']:
-                critical.append(name)
-                logger.error(f"CRITICAL: {name} = {temp:.1f}°F (limit: {sensor_info['critical_threshold']}°F)")
-            elif temp >= sensor_info['warning_threshold']:
-                warnings.append(name)
-                logger.warning(f"WARNING: {name} = {temp:.1f}°F (limit: {sensor_info['warning_threshold']}°F)")
+        time.sleep(self._conversion_time)
+
+        # Raw millidegrees C for every sensor, converted in one step
+        raw = np.fromiter((self._read_raw_bulk(sensor_id, fd) for sensor_id, _, fd in self._read_list),
+                          dtype=np.float64, count=len(self._read_list))
+        temps_f = raw * (9.0 / 5000.0) + 32.0
+
+        # Fall back to a normal read for anything the bulk pass missed
+        for i in np.flatnonzero(np.isnan(temps_f)):
+            sensor_id, _, fd = self._read_list[i]
+            temp = self._read_sensor_fd(sensor_id, fd)
+            temps_f[i] = np.nan if temp is None else temp
+
+        return self._finish_sweep(temps_f)
+
+    def _read_raw_bulk(self, sensor_id: str, fd: Optional[int]) -> float:
+        """
+        Read the stored conversion result of one sensor after a bulk trigger.
+
+        Args:
+            sensor_id: Sensor ID (for log messages)
+            fd: Open descriptor of the sensor's w1_slave file
+
+        Returns:
+            Temperature in millidegrees C, or NaN if it couldn't be read
+        """
+        if fd is None:
+            return np.nan
+        try:
+            data = os.pread(fd, W1_SLAVE_READ_SIZE, 0)
+        except OSError as e:
+            logger.debug(f"Bulk read of {sensor_id} failed: {e}")
+            return np.nan
+
+        raw = self._parse_w1_raw(data) if self._crc_ok(data) else None
+        return np.nan if raw is None else raw
+
+    def _get_cached_all(self) -> Optional[Dict[str, Optional[float]]]:
+        """
+        Return all readings from the cache if every one is still fresh.
+
+        Returns:
+            Dictionary mapping sensor names to temperatures, or None if any
+            sensor needs a new read
+        """
+        now = time.monotonic()
+        values = []
+        for sensor_id, _, _ in self._read_list:
+            cached = self._cache.get(sensor_id)
+            if cached is None or now - cached[0] >= self._cache_ttl:
+                return None
+            values.append(cached[1])
+        # Keep _temps_f in _read_list order like a fresh sweep (None -> NaN)
+        self._temps_f = np.array(values, dtype=np.float64)
+        return {name: temp for (_, name, _), temp in zip(self._read_list, values)}
+
+    def invalidate_cache(self):
+        """Drop all cached readings so the next read goes to the sensors."""
+        self._cache.clear()
+
+    @staticmethod
+    def _crc_ok(data: bytes) -> bool:
+        """
+        Check the driver's CRC verdict on a w1_slave read.
+
+        Args:
+            data: Raw file contents; line 1 ends in "YES" or "NO"
+
+        Returns:
+            True if the scratchpad CRC matched
+        """
+        end = data.find(b'\n')
+        return data[:end if end >= 0 else len(data)].rstrip().endswith(b'YES')
+
+    @staticmethod
+    def _parse_w1_raw(data: bytes) -> Optional[int]:
+        """
+        Parse the contents of a w1_slave file.
+
+        Args:
+            data: Raw file contents, ending in "t=<millidegrees C>"
+
+        Returns:
+            Temperature in millidegrees C, or None if no reading is present
+        """
+        idx = data.rfind(b't=')
+        if idx < 0:
+            return None
+        try:
+            return int(data[idx + 2:])
+        except ValueError:
+            return None
+
+    @classmethod
+    def _parse_w1_slave(cls, data: bytes) -> Optional[float]:
+        """
+        Parse the contents of a w1_slave file into Fahrenheit.
+
+        Args:
+            data: Raw file contents, ending in "t=<millidegrees C>"
+
+        Returns:
+            Temperature in Fahrenheit, or None if no reading is present
+        """
+        raw = cls._parse_w1_raw(data)
+        if raw is None:
+            return None
+        # millidegrees C -> F
+        return raw * 9.0 / 5000.0 + 32.0
+
+    def check_thresholds(self, temps: Optional[Dict[str, Optional[float]]] = None) -> Dict[str, List[str]]:
+        """
+        Check all sensors against warning/critical thresholds.
+
+        Args:
+            temps: Readings from read_all() to check; if None, the sensors
+                are read first
+
+        Returns:
+            Dictionary with 'warnings' and 'critical' lists of sensor names
+        """
+        if temps is None:
+            self.read_all()
+            temps = self._temps_f
+        else:
+            temps = np.array([temps.get(name) for _, name, _ in self._read_list], dtype=np.float64)
+
+        # Failed sensors are NaN and compare False against both limits
+        crit_mask = temps >= self._crit
+        warn_mask = (temps >= self._warn) & ~crit_mask
+
+        if crit_mask.any():
+            for i in np.flatnonzero(crit_mask):
+                logger.error(f"CRITICAL: {self._names[i]} = {temps[i]:.1f}°F (limit: {self._crit[i]:g}°F)")
+        if warn_mask.any():
+            for i in np.flatnonzero(warn_mask):
+                logger.warning(f"WARNING: {self._names[i]} = {temps[i]:.1f}°F (limit: {self._warn[i]:g}°F)")
 
         return {
-            'warnings': warnings,
-            'critical': critical
+            'warnings': self._names[warn_mask].tolist(),
+            'critical': self._names[crit_mask].tolist()
         }
 
     def get_sensor_info(self) -> List[Dict[str, str]]:
@@ -222,16 +603,19 @@ class TemperatureSensors:
         Returns:
             List of sensor info dictionaries
         """
-        info = []
-        for sensor_id, sensor_info in self.sensors.items():
-            info.append({
+        return [
+            {
                 'id': sensor_id,
-                'name': sensor_info['name'],
-                'location': sensor_info['location'],
-                'warning_threshold_f': sensor_info['warning_threshold'],
-                'critical_threshold_f': sensor_info['critical_threshold']
-            })
-        return info
+                'name': name,
+                'location': location,
+                'warning_threshold_f': warn,
+                'critical_threshold_f': crit
+            }
+            for sensor_id, name, location, warn, crit in zip(
+                self._ids.tolist(), self._names.tolist(), self._locations.tolist(),
+                self._warn.tolist(), self._crit.tolist()
+            )
+        ]
 
     def identify_sensors(self) -> Dict[str, str]:
         """
@@ -243,13 +627,15 @@ class TemperatureSensors:
         Returns:
             Dictionary mapping sensor IDs to current temperatures
         """
-        temps = {}
-
-        for sensor_id in self.sensors.keys():
-            temp = self.read_sensor(sensor_id)
-            temps[sensor_id] = f"{temp:.1f}°F" if temp else "ERROR"
+        self.read_all()
 
-        return temps
+        # _temps_f is indexed like _read_list; the name-keyed dict from
+        # read_all() would merge sensors that share a name
+        temps = self._temps_f.tolist()
+        return {
+            sensor_id: "ERROR" if temps[i] != temps[i] else f"{temps[i]:.1f}°F"  # NaN = failed read
+            for i, (sensor_id, _, _) in enumerate(self._read_list)
+        }
 
     def _get_simulated_temp(self, sensor_name: str) -> float:
         """
@@ -261,10 +647,14 @@ class TemperatureSensors:
         Returns:
             Simulated temperature in Fahrenheit
         """
-        base_temp = self.sim_temps.get(sensor_name, 100.0)
+        idx = self._sim_index.get(sensor_name)
+        if idx is None:
+            return 100.0 + self._rng.uniform(-5, 10)
+
+        base_temp = self._sim_base[idx]
 
         # Add random variation
-        variation = random.uniform(-5, 10)
+        variation = self._rng.uniform(-5, 10)
 
         # Slowly increase over time (simulating heat buildup)
         time_factor = (time.time() % 600) / 600  # 10-minute cycle
@@ -273,9 +663,41 @@ class TemperatureSensors:
         temp = base_temp + variation + heat_increase
 
         # Update base for next time
-        self.sim_temps[sensor_name] = base_temp + 0.1
+        self._sim_base[idx] = base_temp + 0.1
 
-        return temp
+        return float(temp)
+
+    def _get_simulated_temps_vec(self) -> np.ndarray:
+        """
+        Generate simulated temperatures for all sensors at once.
+
+        Returns:
+            Array of temperatures in Fahrenheit, in self.sensors order
+        """
+        # Slowly increase over time (simulating heat buildup)
+        heat_increase = (time.time() % 600) / 600 * 20  # 10-minute cycle
+
+        temps = self._sim_base + self._rng.uniform(-5, 10, size=len(self._sim_base)) + heat_increase
+
+        # Update bases for next time
+        self._sim_base += 0.1
+
+        return temps
+
+    def close(self):
+        """Shut down the sensor read threads and close the sensor files."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+        for fd in self._fds.values():
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._fds.clear()
+        self._build_read_list()
+        self.connected = False
 
     def is_connected(self) -> bool:
         """Check if temperature sensors are connected."""
@@ -328,18 +750,13 @@ if __name__ == "__main__":
 
     temp_sensors = TemperatureSensors(test_config, simulation_mode=True)
 
-    if temp_sensors.connect():
-        print(f"Connected {temp_sensors.get_count()} temperature sensors")
-
-        # Print sensor info
-        print("\nConfigured sensors:")
-        for info in temp_sensors.get_sensor_info():
-            print(f"  {info['name']}: {info['location']}")
-
-        # Test reading temperatures
+    async def main():
+        # Test reading temperatures; each read overlaps the 1 s tick
+        # instead of adding to it
         for i in range(10):
+            temps, _ = await asyncio.gather(temp_sensors.read_all_async(), asyncio.sleep(1.0))
+
             print(f"\n--- Reading {i+1} ---")
-            temps = temp_sensors.read_all()
             for name, temp in temps.items():
                 if temp:
                     print(f"  {name}: {temp:.1f}°F")
@@ -347,12 +764,21 @@ if __name__ == "__main__":
                     print(f"  {name}: ERROR")
 
             # Check thresholds
-            alerts = temp_sensors.check_thresholds()
+            alerts = temp_sensors.check_thresholds(temps)
             if alerts['warnings']:
                 print(f"  WARNINGS: {', '.join(alerts['warnings'])}")
             if alerts['critical']:
                 print(f"  CRITICAL: {', '.join(alerts['critical'])}")
 
-            time.sleep(1)
+    if temp_sensors.connect():
+        print(f"Connected {temp_sensors.get_count()} temperature sensors")
+
+        # Print sensor info
+        print("\nConfigured sensors:")
+        for info in temp_sensors.get_sensor_info():
+            print(f"  {info['name']}: {info['location']}")
+
+        asyncio.run(main())
+        temp_sensors.close()
     else:
         print("Failed to connect")
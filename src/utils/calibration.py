@@ -4,15 +4,36 @@ Tools for calibrating accelerometer, GPS, and temperature sensors.
 """
 
 import logging
+import os
+import sys
 import time
 import json
 import numpy as np
 from pathlib import Path
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Tuple, Any, Optional
 
 logger = logging.getLogger(__name__)
 
 
+def _write_json_atomic(path: Path, data: Dict[str, Any]):
+    """
+    Write JSON to a file so a crash can't leave it half-written.
+
+    The data goes to a temporary file next to the target, which then
+    replaces the target in a single rename.
+
+    Args:
+        path: File to write
+        data: JSON-serializable data
+    """
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp, 'w') as f:
+        json.dump(data, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
 class AccelerometerCalibration:
     """
     Calibration tools for MPU6050 accelerometer.
@@ -29,7 +50,9 @@ class AccelerometerCalibration:
         """
         self.accel = accelerometer
 
-    def calibrate_zero_point(self, samples: int = 100, duration_seconds: float = 10) -> Dict[str, float]:
+    def calibrate_zero_point(self, samples: int = 100, duration_seconds: float = 10,
+                             sample_rate_hz: Optional[float] = None,
+                             trace_path: Optional[str] = None) -> Dict[str, float]:
         """
         Calibrate accelerometer zero point (stationary, level vehicle).
 
@@ -38,10 +61,19 @@ class AccelerometerCalibration:
         Args:
             samples: Number of samples to collect
             duration_seconds: Duration to collect samples
+            sample_rate_hz: Sensor output rate to pace reads at; overrides
+                duration_seconds when given
+            trace_path: If given, raw samples are streamed to this file as a
+                (samples, 6) float32 array [ax, ay, az, gx, gy, gz] for
+                offline analysis (load with np.memmap)
 
         Returns:
             Dictionary with calibration offsets
         """
+        if sample_rate_hz:
+            duration_seconds = samples / sample_rate_hz
+        interval = duration_seconds / samples
+
         print("\n" + "=" * 60)
         print("ACCELEROMETER ZERO POINT CALIBRATION")
         print("=" * 60)
@@ -49,30 +81,49 @@ class AccelerometerCalibration:
         print("1. Park vehicle on level ground")
         print("2. Turn off engine")
         print("3. Ensure no movement for entire calibration period")
-        print(f"4. Will collect {samples} samples over {duration_seconds} seconds")
+        print(f"4. Will collect {samples} samples over {duration_seconds:g} seconds")
         print("\nPress Enter when ready...")
         input()
 
         print(f"\nCollecting samples (do not move vehicle)...")
 
-        accel_samples = []
-        gyro_samples = []
+        # Running mean and sum of squared deviations (Welford), rows are
+        # accel and gyro, so no samples need to be kept
+        mean = np.zeros((2, 3))
+        m2 = np.zeros((2, 3))
+        count = 0
 
-        interval = duration_seconds / samples
+        # Disk-backed raw trace, written in place without growing memory
+        trace = None
+        if trace_path:
+            trace = np.memmap(trace_path, dtype=np.float32, mode='w+', shape=(samples, 6))
+
+        # Pace against a fixed schedule so read time doesn't add to the interval
+        next_t = time.monotonic()
 
-        for i in range(samples):
-            accel, gyro = self.accel.read_raw()
-            accel_samples.append(accel)
-            gyro_samples.append(gyro)
+        while count < samples:
+            x = np.array(self.accel.read_raw(), dtype=np.float64)
+            if trace is not None:
+                trace[count] = x.reshape(6)
 
-            if (i + 1) % 10 == 0:
-                print(f"  Sample {i+1}/{samples}")
+            count += 1
+            delta = x - mean
+            mean += delta / count
+            m2 += delta * (x - mean)
 
-            time.sleep(interval)
+            if count % 10 == 0:
+                print(f"  Sample {count}/{samples}")
+
+            next_t += interval
+            time.sleep(max(0.0, next_t - time.monotonic()))
+
+        if trace is not None:
+            trace.flush()
+            del trace
+            print(f"Raw samples saved to {trace_path}")
 
         # Calculate mean offsets
-        accel_mean = np.mean(accel_samples, axis=0)
-        gyro_mean = np.mean(gyro_samples, axis=0)
+        accel_mean, gyro_mean = mean
 
         # Expected: Z-axis should read +9.8 m/s² (gravity), X and Y should be ~0
         # Offsets are what we need to subtract to get to ideal values
@@ -92,10 +143,10 @@ class AccelerometerCalibration:
         print(f"  Z: {gyro_offset[2]:.4f}")
 
         # Calculate standard deviations to check stability
-        accel_std = np.std(accel_samples, axis=0)
+        accel_std, gyro_std = np.sqrt(m2 / samples)
         print(f"\nStability (std dev):")
         print(f"  Accel: {np.linalg.norm(accel_std):.4f} m/s²")
-        print(f"  Gyro: {np.linalg.norm(np.std(gyro_samples, axis=0)):.4f} rad/s")
+        print(f"  Gyro: {np.linalg.norm(gyro_std):.4f} rad/s")
 
         if np.linalg.norm(accel_std) > 0.5:
             print("\nWARNING: High standard deviation - vehicle may have moved during calibration")
@@ -160,8 +211,7 @@ class AccelerometerCalibration:
             config['accelerometer']['calibration'].update(calibration_data)
 
             # Save updated config
-            with open(config_path, 'w') as f:
-                json.dump(config, f, indent=2)
+            _write_json_atomic(config_path, config)
 
             print(f"\nCalibration saved to {config_path}")
 
@@ -209,21 +259,26 @@ class TemperatureCalibration:
                 # Read all sensors
                 sensor_ids = self.temp_sensors.identify_sensors()
 
-                # Clear screen (simple version)
-                print("\033[2J\033[H")  # ANSI escape codes
-                print("=" * 60)
-                print(f"Temperature Sensor Readings - {time.strftime('%H:%M:%S')}")
-                print("=" * 60)
+                # Build the whole frame and write it at once, so the
+                # terminal gets one write per refresh instead of one per line
+                frame = [
+                    "\033[2J\033[H",  # Clear screen (ANSI escape codes)
+                    "=" * 60,
+                    f"Temperature Sensor Readings - {time.strftime('%H:%M:%S')}",
+                    "=" * 60
+                ]
 
                 # Display readings
                 for sensor_id, temp in sensor_ids.items():
-                    name = self.temp_sensors.sensors.get(sensor_id, {}).get('name', 'Unknown')
-                    location = self.temp_sensors.sensors.get(sensor_id, {}).get('location', 'Unknown')
-                    print(f"{sensor_id}")
-                    print(f"  Name: {name}")
-                    print(f"  Location: {location}")
-                    print(f"  Temperature: {temp}")
-                    print()
+                    info = self.temp_sensors.sensors.get(sensor_id, {})
+                    frame.append(f"{sensor_id}")
+                    frame.append(f"  Name: {info.get('name', 'Unknown')}")
+                    frame.append(f"  Location: {info.get('location', 'Unknown')}")
+                    frame.append(f"  Temperature: {temp}")
+                    frame.append("")
+
+                sys.stdout.write("\n".join(frame) + "\n")
+                sys.stdout.flush()
 
                 time.sleep(1)
 
@@ -251,8 +306,7 @@ class TemperatureCalibration:
             config['temperature']['sensors'] = mapping
 
             # Save updated config
-            with open(config_path, 'w') as f:
-                json.dump(config, f, indent=2)
+            _write_json_atomic(config_path, config)
 
             print(f"\nSensor mapping saved to {config_path}")
 
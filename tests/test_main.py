@@ -0,0 +1,102 @@
+"""Tests for the DataLogger CSV writer path."""
+
+import csv
+import json
+import shutil
+import time
+from pathlib import Path
+
+import pytest
+
+import main
+
+CONFIG_DIR = Path(__file__).resolve().parent.parent / "config"
+
+
+class FlakyWriter:
+    """csv.writer wrapper whose first `failures` writerows calls raise OSError."""
+
+    def __init__(self, writer, failures):
+        self._writer = writer
+        self.failures = failures
+
+    def writerows(self, rows):
+        if self.failures:
+            self.failures -= 1
+            raise OSError("simulated disk error")
+        self._writer.writerows(rows)
+
+
+@pytest.fixture
+def logger_factory(tmp_path):
+    """Build a DataLogger with a small buffer and an open session."""
+    config_dir = tmp_path / "config"
+    shutil.copytree(CONFIG_DIR, config_dir)
+    system_path = config_dir / "system_config.json"
+    system = json.loads(system_path.read_text())
+    system["logging"]["file_output"] = False
+    system["data"]["csv_buffer_size"] = 10
+    system["data"]["csv_write_retries"] = 2
+    system_path.write_text(json.dumps(system))
+
+    def factory():
+        dl = main.DataLogger(config_dir=str(config_dir), data_dir=str(tmp_path / "sessions"))
+        assert dl.create_session()
+        return dl
+
+    return factory
+
+
+def _sample(i):
+    row = dict.fromkeys(main.DataLogger.CSV_HEADERS)
+    row['timestamp'] = i
+    return row
+
+
+def _written_timestamps(dl):
+    dl._stop_writer()
+    dl.csv_file.close()
+    with open(dl.session_dir / "data.csv", newline='') as f:
+        rows = list(csv.reader(f))[1:]
+    return [int(r[0]) for r in rows]
+
+
+def _feed(dl, start, count):
+    for i in range(start, start + count):
+        dl.write_data(_sample(i))
+        # Give the writer thread a chance to drain between hand-overs
+        time.sleep(0.001)
+
+
+def test_writer_recovers_after_transient_failure(logger_factory):
+    dl = logger_factory()
+    dl.csv_writer = FlakyWriter(dl.csv_writer, failures=1)
+
+    _feed(dl, 0, 200)
+
+    assert _written_timestamps(dl) == list(range(200))
+    assert dl._write_dropped == 0
+
+
+def test_writer_drops_rows_after_retry_limit(logger_factory):
+    dl = logger_factory()
+    dl.csv_writer = FlakyWriter(dl.csv_writer, failures=2)
+
+    _feed(dl, 0, 200)
+
+    written = _written_timestamps(dl)
+    # Only the first buffer is lost; everything after it reaches the file
+    assert dl._write_dropped == 10
+    assert written == list(range(10, 200))
+
+
+def test_stop_is_idempotent(logger_factory):
+    dl = logger_factory()
+    _feed(dl, 0, 5)
+
+    dl.stop()
+    dl.stop()
+
+    assert dl.csv_file is None
+    with open(dl.session_dir / "data.csv", newline='') as f:
+        assert len(list(csv.reader(f))) == 6
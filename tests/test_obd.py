@@ -0,0 +1,51 @@
+"""Tests for OBDInterface multi-PID request handling."""
+
+from sensors.obd import OBDInterface
+
+
+class FakeResponse:
+    def __init__(self, value):
+        self.value = value
+
+    def is_null(self):
+        return self.value is None
+
+
+class FakeConnection:
+    """Answers the multi-PID request with queued values (None = no answer)."""
+
+    def __init__(self, answers):
+        self.answers = list(answers)
+
+    def query(self, cmd, force=False):
+        return FakeResponse(self.answers.pop(0))
+
+
+def _interface(answers, max_failures=3):
+    interface = OBDInterface({'fast_pids': ['RPM'], 'slow_pids': [],
+                              'multi_pid_max_failures': max_failures})
+    interface.connection = FakeConnection(answers)
+    interface.connected = True
+    interface._multi_cmds[('RPM',)] = [(object(), ['RPM'])]
+    return interface
+
+
+def test_single_multi_pid_miss_does_not_disable_multi_pid():
+    interface = _interface([None, {'RPM': 3000}])
+
+    assert interface.read_multi(['RPM']) == {}
+    assert interface._multi_pid_ok
+    assert interface.read_multi(['RPM']) == {'RPM': 3000}
+    assert interface._multi_failures == 0
+
+
+def test_consecutive_multi_pid_misses_disable_multi_pid():
+    interface = _interface([None, None, None, {'RPM': 3000}])
+
+    for _ in range(3):
+        interface.read_multi(['RPM'])
+
+    assert not interface._multi_pid_ok
+    # Now on single-PID reads, which the stub obd has no commands for
+    assert interface.read_multi(['RPM']) == {}
+    assert interface.connection.answers == [{'RPM': 3000}]
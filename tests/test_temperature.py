@@ -0,0 +1,102 @@
+"""Tests for TemperatureSensors against a fake 1-Wire sysfs tree."""
+
+import pytest
+
+from sensors import temperature
+
+
+def _w1_slave(millidegrees):
+    scratchpad = "72 01 4b 46 7f ff 0e 10 57"
+    return f"{scratchpad} : crc=57 YES\n{scratchpad} t={millidegrees}\n"
+
+
+@pytest.fixture
+def w1_tree(tmp_path, monkeypatch):
+    """Point the module at a temporary w1 sysfs tree and return a sensor factory."""
+    bus = tmp_path / "w1_bus_master1"
+    bus.mkdir()
+    monkeypatch.setattr(temperature, "W1_DEVICES_DIR", str(tmp_path))
+    monkeypatch.setattr(temperature, "HAS_W1", True)
+    monkeypatch.setattr(temperature, "MAX_CONVERSION_TIME", 0.01)
+
+    def add_sensor(sensor_id, millidegrees):
+        device = tmp_path / sensor_id
+        device.mkdir()
+        (device / "w1_slave").write_text(_w1_slave(millidegrees))
+        (bus / sensor_id).symlink_to(device)
+
+    return add_sensor
+
+
+def _connect(config):
+    sensors = temperature.TemperatureSensors(config)
+    assert sensors.connect()
+    return sensors
+
+
+def test_identify_sensors_with_colliding_names(w1_tree):
+    # Both probes are configured under the same name
+    w1_tree("28-000000000001", 25000)
+    w1_tree("28-000000000002", 100000)
+    config = {'sensors': {
+        sensor_id: {'name': 'brake', 'location': 'front', 'warning_threshold_f': 150}
+        for sensor_id in ("28-000000000001", "28-000000000002")
+    }}
+    sensors = _connect(config)
+    try:
+        assert sensors.identify_sensors() == {
+            "28-000000000001": "77.0°F",
+            "28-000000000002": "212.0°F",
+        }
+        # Second pass is served from the cache and must stay aligned too
+        assert sensors.identify_sensors()["28-000000000002"] == "212.0°F"
+        assert sensors.check_thresholds() == {'warnings': ['brake'], 'critical': []}
+    finally:
+        sensors.close()
+
+
+def test_cached_reads_stay_aligned_when_unknown_names_collide(w1_tree):
+    # Unknown sensors are named from the first 8 characters of their ID,
+    # which these two share
+    w1_tree("28-00000aaaa001", 0)
+    w1_tree("28-00000aaaa002", 50000)
+    sensors = _connect({'sensors': {}})
+    try:
+        sensors.read_all()
+        # Cached pass feeds check_thresholds one reading per sensor
+        sensors.read_all()
+        assert sensors.check_thresholds() == {'warnings': [], 'critical': []}
+        assert sensors.identify_sensors() == {
+            "28-00000aaaa001": "32.0°F",
+            "28-00000aaaa002": "122.0°F",
+        }
+    finally:
+        sensors.close()
+
+
+def test_discovers_other_thermometer_families(w1_tree):
+    w1_tree("10-000801b5a7c3", 21500)   # DS18S20
+    w1_tree("28-000000000001", 25000)   # DS18B20
+    w1_tree("3b-0000001a2b3c", -1250)   # MAX31850
+    w1_tree("01-000012345678", 0)       # DS2401 serial number, not a thermometer
+    sensors = _connect({'sensors': {}})
+    try:
+        assert sorted(sensors.sensors) == ["10-000801b5a7c3", "28-000000000001", "3b-0000001a2b3c"]
+        assert sensors.identify_sensors()["3b-0000001a2b3c"] == "29.8°F"
+    finally:
+        sensors.close()
+
+
+def test_colliding_unknown_sensor_names_are_disambiguated(w1_tree):
+    w1_tree("28-00000aaaa001", 0)
+    w1_tree("28-00000aaaa002", 50000)
+    w1_tree("28-3c01d607a1b2", 25000)
+    sensors = _connect({'sensors': {}})
+    try:
+        assert sensors.read_all() == {
+            "unknown_28-00000": 32.0,
+            "unknown_28-00000aaaa002": 122.0,
+            "unknown_28-3c01d": 77.0,
+        }
+    finally:
+        sensors.close()